@@ -0,0 +1,130 @@
+"""
+Unit tests for worldcar.graph_loader module.
+"""
+
+import os
+
+import pytest
+import networkx as nx
+
+import worldcar.graph_loader as graph_loader
+from worldcar.graph_loader import GraphLoader
+
+BBOX = (40.99, 40.95, 29.05, 29.00)  # north, south, east, west
+
+
+@pytest.fixture
+def bbox_calls(monkeypatch):
+    """Record ox.graph_from_bbox calls instead of hitting Overpass."""
+    calls = []
+
+    def fake_graph_from_bbox(*args, **kwargs):
+        calls.append(args)
+        G = nx.MultiDiGraph(crs="EPSG:4326")
+        G.add_node(1, y=40.96, x=29.01)
+        G.add_node(2, y=40.97, x=29.02)
+        G.add_edge(1, 2, length=1400.0)
+        return G
+
+    monkeypatch.setattr(graph_loader.ox, 'graph_from_bbox', fake_graph_from_bbox)
+    return calls
+
+
+class TestDownloadByBbox:
+    """Test that the bbox reaches OSMnx in the order its version expects."""
+
+    def test_osmnx_2_takes_west_south_east_north(self, bbox_calls, monkeypatch):
+        """OSMnx 2.x gets a single (west, south, east, north) tuple."""
+        monkeypatch.setattr(graph_loader.ox, '__version__', '2.0.1')
+
+        GraphLoader("Somewhere", bbox=BBOX).download_network()
+
+        assert bbox_calls == [((29.00, 40.95, 29.05, 40.99),)]
+
+    def test_osmnx_1_takes_north_south_east_west(self, bbox_calls, monkeypatch):
+        """OSMnx 1.x gets north, south, east, west positionally."""
+        monkeypatch.setattr(graph_loader.ox, '__version__', '1.9.3')
+
+        GraphLoader("Somewhere", bbox=BBOX).download_network()
+
+        assert bbox_calls == [(40.99, 40.95, 29.05, 29.00)]
+
+
+@pytest.fixture
+def graphml_loads(monkeypatch, tmp_path):
+    """Stand in for ox.load_graphml, counting how often a file is parsed."""
+    loads = []
+
+    def fake_load_graphml(filepath):
+        loads.append(filepath)
+        G = nx.MultiDiGraph(crs="EPSG:4326")
+        with open(filepath) as f:
+            num_nodes = int(f.read())
+        for node in range(num_nodes):
+            G.add_node(node, y=40.96, x=29.01 + node / 1000)
+        G.add_edges_from(zip(range(num_nodes - 1), range(1, num_nodes)), length=10.0)
+        return G
+
+    monkeypatch.setattr(graph_loader.ox, 'load_graphml', fake_load_graphml)
+    graph_loader._load_cached.cache_clear()
+    yield loads
+    graph_loader._load_cached.cache_clear()
+
+
+def write_graph_file(path, num_nodes, mtime):
+    """Write a fake GraphML file holding a node count, with a fixed mtime."""
+    path.write_text(str(num_nodes))
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class TestLoadFromCache:
+    """Test the process-wide cache of loaded GraphML files."""
+
+    def test_file_is_parsed_once_until_it_changes(self, graphml_loads, tmp_path):
+        """Same path and mtime reuse the parsed graph; a newer file is re-read."""
+        filepath = write_graph_file(tmp_path / "graph.graphml", 2, 1_000_000)
+
+        GraphLoader("Somewhere").load_from_cache(filepath)
+        GraphLoader("Somewhere").load_from_cache(filepath)
+        assert len(graphml_loads) == 1
+
+        write_graph_file(tmp_path / "graph.graphml", 3, 2_000_000)
+        G = GraphLoader("Somewhere").load_from_cache(filepath)
+
+        assert len(graphml_loads) == 2
+        assert G.number_of_nodes() == 3
+
+    def test_loaders_do_not_share_graph_objects(self, graphml_loads, tmp_path):
+        """Editing one loader's graph leaves other loaders' graphs intact."""
+        filepath = write_graph_file(tmp_path / "graph.graphml", 2, 1_000_000)
+
+        G1 = GraphLoader("Somewhere").load_from_cache(filepath)
+        G1.add_node(99)
+        G2 = GraphLoader("Somewhere").load_from_cache(filepath)
+
+        assert G1 is not G2
+        assert G2.number_of_nodes() == 2
+        assert len(graphml_loads) == 1
+
+
+class TestGraphInfo:
+    """Test the node, edge and component counts cached by get_graph_info."""
+
+    def test_counts_refresh_after_reload(self, graphml_loads, tmp_path, monkeypatch):
+        """Reloading a changed file replaces the cached counts."""
+        filepath = write_graph_file(tmp_path / "graph.graphml", 2, 1_000_000)
+        monkeypatch.setattr(graph_loader, 'PROCESSED_GRAPH_PATH', filepath)
+        loader = GraphLoader("Somewhere")
+
+        loader.get_or_create_graph()
+        info = loader.get_graph_info()
+        assert (info['num_nodes'], info['num_edges']) == (2, 1)
+        assert info['num_connected_components'] == 1
+
+        write_graph_file(tmp_path / "graph.graphml", 4, 2_000_000)
+        loader.reload()
+
+        info = loader.get_graph_info()
+        assert (info['num_nodes'], info['num_edges']) == (4, 3)
+        assert info['num_connected_components'] == 1
@@ -0,0 +1,102 @@
+"""
+Unit tests for worldcar.node_mapper module.
+"""
+
+import pytest
+import networkx as nx
+
+import worldcar.node_mapper as node_mapper
+from worldcar.node_mapper import NodeMapper
+
+
+@pytest.fixture
+def graph():
+    """Small grid of intersections in Kadıköy."""
+    G = nx.MultiDiGraph()
+    G.add_node(1, y=40.9800, x=29.0200)
+    G.add_node(2, y=40.9800, x=29.0300)
+    G.add_node(3, y=40.9900, x=29.0200)
+    G.add_node(4, y=40.9900, x=29.0300)
+    G.add_edge(1, 2, length=840.0)
+    G.add_edge(3, 4, length=840.0)
+    return G
+
+
+class TestSpatialIndex:
+    """Test KDTree construction and nearest-node lookups."""
+
+    def test_city_graph_is_projected_to_utm(self, graph):
+        """A city-sized graph is indexed in its local UTM zone."""
+        mapper = NodeMapper(graph)
+
+        assert mapper.projected_crs == "EPSG:32635"
+        assert mapper.get_stats()['projected_crs'] == "EPSG:32635"
+
+    def test_projected_lookup(self, graph):
+        """Projected KDTree finds the nearest node and honors max_distance."""
+        mapper = NodeMapper(graph)
+
+        assert mapper.find_nearest_node(40.9801, 29.0299) == 2
+        assert mapper.find_nearest_node(40.9801, 29.0299, max_distance=1.0) is None
+
+    def test_wide_graph_is_not_projected(self, graph):
+        """Graphs spanning more than the projection limit keep degrees."""
+        graph.add_node(5, y=42.5, x=31.0)
+        mapper = NodeMapper(graph)
+
+        assert mapper.projected_crs is None
+        assert mapper.find_nearest_node(40.9899, 29.0201) == 3
+
+    def test_fallback_without_kdtree(self, graph, monkeypatch):
+        """With the KDTree disabled, brute force search gives the same node."""
+        monkeypatch.setattr(node_mapper, 'KDTREE_ENABLED', False)
+        mapper = NodeMapper(graph)
+
+        assert mapper.kdtree is None
+        assert mapper.find_nearest_node(40.9801, 29.0299) == 2
+        assert mapper.find_nearest_node(40.9801, 29.0299, max_distance=1.0) is None
+
+
+class TestBatchLookup:
+    """Test batch_find_nearest_nodes and its single-query batch path."""
+
+    def test_batch_matches_single(self, graph):
+        """One batched KDTree query agrees with per-point lookups."""
+        mapper = NodeMapper(graph)
+        coords = [(40.9801, 29.0299), (40.9899, 29.0201), (40.9851, 29.0210)]
+        expected = [mapper.find_nearest_node(lat, lon) for lat, lon in coords]
+
+        assert mapper.batch_find_nearest_nodes(coords) == expected
+
+    def test_batch_invalid_and_far_points_are_none(self, graph):
+        """Invalid coordinates and points beyond max_distance map to None."""
+        mapper = NodeMapper(graph)
+        coords = [(40.9801, 29.0299), (95.0, 29.0), (40.9851, 29.0210)]
+
+        assert mapper._batch_query(coords, max_distance=50.0) == [2, None, None]
+
+    def test_batch_fallback_without_kdtree(self, graph, monkeypatch):
+        """Brute force batch lookup matches the KDTree result."""
+        coords = [(40.9801, 29.0299), (40.9899, 29.0201)]
+        expected = NodeMapper(graph).batch_find_nearest_nodes(coords)
+
+        monkeypatch.setattr(node_mapper, 'KDTREE_ENABLED', False)
+        assert NodeMapper(graph).batch_find_nearest_nodes(coords) == expected
+
+
+class TestCoordinateExtraction:
+    """Test bulk extraction of node coordinates."""
+
+    def test_coordinates_follow_node_ids(self, graph):
+        """node_coords rows are (lat, lon) in node_ids order."""
+        mapper = NodeMapper(graph)
+
+        for node_id, (lat, lon) in zip(mapper.node_ids, mapper.node_coords):
+            assert (lat, lon) == (graph.nodes[node_id]['y'], graph.nodes[node_id]['x'])
+
+    def test_missing_coordinates_raise(self, graph):
+        """A node without x/y is reported by ID."""
+        graph.add_node(99, y=40.98)
+
+        with pytest.raises(ValueError, match="Node 99"):
+            NodeMapper(graph)
@@ -0,0 +1,266 @@
+"""
+Unit tests for worldcar.simple_graph_loader module.
+"""
+
+import pytest
+import networkx as nx
+
+import worldcar.simple_graph_loader as simple_graph_loader
+from worldcar.simple_graph_loader import (
+    _ensure_edge_lengths,
+    get_graph_stats,
+    load_city_graph,
+    load_city_graphs,
+    print_graph_info,
+)
+
+
+def make_graph(created_with="OSMnx 2.1.1"):
+    """Two one-way road segments, shaped like an OSMnx download."""
+    G = nx.MultiDiGraph(crs="EPSG:4326", created_with=created_with)
+    G.add_node(1, y=40.9800, x=29.0200)
+    G.add_node(2, y=40.9800, x=29.0300)
+    G.add_node(3, y=40.9900, x=29.0300)
+    G.add_edge(1, 2, length=840.0)
+    G.add_edge(2, 3, length=1110.0)
+    return G
+
+
+@pytest.fixture
+def place_calls(monkeypatch):
+    """Record ox.graph_from_place calls instead of hitting Overpass."""
+    calls = []
+
+    def fake_graph_from_place(city_name, **kwargs):
+        calls.append(city_name)
+        if city_name == "Atlantis":
+            raise ValueError("Nominatim could not geocode query 'Atlantis'")
+        return make_graph()
+
+    monkeypatch.setattr(
+        simple_graph_loader.ox, 'graph_from_place', fake_graph_from_place
+    )
+    return calls
+
+
+@pytest.fixture
+def added_lengths(monkeypatch):
+    """Record ox.distance.add_edge_lengths calls, filling in a dummy length."""
+    calls = []
+
+    def fake_add_edge_lengths(G):
+        calls.append(G)
+        for _, _, data in G.edges(data=True):
+            data.setdefault('length', 1.0)
+        return G
+
+    monkeypatch.setattr(
+        simple_graph_loader.ox.distance, 'add_edge_lengths', fake_add_edge_lengths
+    )
+    return calls
+
+
+class TestEnsureEdgeLengths:
+    """Test the edge length check run on freshly loaded graphs."""
+
+    def test_osmnx_graph_is_trusted_after_one_edge(self, added_lengths):
+        """OSMnx graphs are checked on a sampled edge only."""
+        G = make_graph()
+        G.add_edge(3, 1)
+
+        _ensure_edge_lengths(G)
+
+        assert added_lengths == []
+        assert G.graph['_lengths_verified'] is True
+
+    def test_other_graphs_are_scanned(self, added_lengths):
+        """Any edge without a length triggers add_edge_lengths."""
+        G = make_graph(created_with="")
+        G.add_edge(3, 1)
+
+        G = _ensure_edge_lengths(G)
+
+        assert added_lengths == [G]
+        assert all('length' in data for _, _, data in G.edges(data=True))
+
+    def test_verified_graph_is_not_rechecked(self, added_lengths):
+        """The verified flag short-circuits later calls."""
+        G = make_graph(created_with="")
+        _ensure_edge_lengths(G)
+        G.add_edge(3, 1)
+
+        _ensure_edge_lengths(G)
+
+        assert added_lengths == []
+
+
+class TestDiskCache:
+    """Test the on-disk cache used by load_city_graph."""
+
+    @pytest.mark.parametrize("cache_format", ["pickle", "graphml"])
+    def test_round_trip(self, place_calls, tmp_path, cache_format):
+        """A cached city is read back from disk without downloading."""
+        G = load_city_graph("Kadıköy", cache_dir=tmp_path, cache_format=cache_format)
+        cached = load_city_graph(
+            " kadıköy ", cache_dir=tmp_path, cache_format=cache_format
+        )
+
+        assert place_calls == ["Kadıköy"]
+        assert sorted(cached.edges(data='length')) == sorted(G.edges(data='length'))
+        assert cached.nodes[2] == G.nodes[2]
+
+    def test_graphml_leaves_out_private_keys(self, place_calls, tmp_path):
+        """Private bookkeeping keys are not saved but stay on the graph."""
+        G = load_city_graph("Kadıköy", cache_dir=tmp_path, cache_format="graphml")
+
+        (cache_file,) = tmp_path.iterdir()
+        assert "_lengths_verified" not in cache_file.read_text()
+        assert G.graph['_lengths_verified'] is True
+
+    def test_force_refresh_downloads_again(self, place_calls, tmp_path):
+        """force_refresh skips the cached copy and overwrites it."""
+        load_city_graph("Kadıköy", cache_dir=tmp_path)
+        (cache_file,) = tmp_path.iterdir()
+        cache_file.write_bytes(b"stale")
+
+        load_city_graph("Kadıköy", cache_dir=tmp_path, force_refresh=True)
+
+        assert place_calls == ["Kadıköy", "Kadıköy"]
+        assert cache_file.read_bytes() != b"stale"
+        assert load_city_graph("Kadıköy", cache_dir=tmp_path).number_of_nodes() == 3
+
+    def test_unreadable_cache_is_replaced(self, place_calls, tmp_path):
+        """A corrupt cache file falls back to a download."""
+        load_city_graph("Kadıköy", cache_dir=tmp_path)
+        (cache_file,) = tmp_path.iterdir()
+        cache_file.write_bytes(b"not a pickle")
+
+        G = load_city_graph("Kadıköy", cache_dir=tmp_path)
+
+        assert G.number_of_nodes() == 3
+        assert len(place_calls) == 2
+
+    def test_failed_write_keeps_old_file(self, place_calls, tmp_path, monkeypatch):
+        """Writes go through a temp file, so a failure leaves no partial file."""
+        load_city_graph("Kadıköy", cache_dir=tmp_path)
+        (cache_file,) = tmp_path.iterdir()
+        before = cache_file.read_bytes()
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(simple_graph_loader.pickle, 'dump', fail)
+        G = load_city_graph("Kadıköy", cache_dir=tmp_path, force_refresh=True)
+
+        assert G.number_of_nodes() == 3
+        assert list(tmp_path.iterdir()) == [cache_file]
+        assert cache_file.read_bytes() == before
+
+    def test_disabled_cache_always_downloads(self, place_calls):
+        """cache_dir=None skips the disk cache."""
+        load_city_graph("Kadıköy", cache_dir=None)
+        load_city_graph("Kadıköy", cache_dir=None)
+
+        assert len(place_calls) == 2
+
+    def test_unknown_format(self, place_calls, tmp_path):
+        """Unsupported cache formats are rejected up front."""
+        with pytest.raises(ValueError, match="cache format"):
+            load_city_graph("Kadıköy", cache_dir=tmp_path, cache_format="json")
+        assert place_calls == []
+
+
+class TestLoadCityGraphs:
+    """Test concurrent loading of several cities."""
+
+    def test_results_follow_input_order(self, place_calls, tmp_path):
+        """Every city maps to its graph, in the order asked for."""
+        cities = ["Kadıköy", "Beşiktaş", "Üsküdar"]
+
+        graphs = load_city_graphs(cities, max_workers=2, cache_dir=tmp_path)
+
+        assert list(graphs) == cities
+        assert all(G.number_of_nodes() == 3 for G in graphs.values())
+        assert sorted(place_calls) == sorted(cities)
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_failed_city_maps_to_none(self, place_calls):
+        """One bad city does not abort the others."""
+        graphs = load_city_graphs(["Atlantis", "Kadıköy"], cache_dir=None)
+
+        assert graphs["Atlantis"] is None
+        assert graphs["Kadıköy"].number_of_nodes() == 3
+
+    def test_cache_settings_are_passed_on(self, place_calls, tmp_path):
+        """Cached cities are reused unless force_refresh is set."""
+        load_city_graphs(["Kadıköy"], cache_dir=tmp_path)
+        load_city_graphs(["Kadıköy"], cache_dir=tmp_path)
+        assert place_calls == ["Kadıköy"]
+
+        load_city_graphs(["Kadıköy"], cache_dir=tmp_path, force_refresh=True)
+        assert place_calls == ["Kadıköy", "Kadıköy"]
+
+    def test_no_cities(self, place_calls):
+        """An empty request returns an empty mapping."""
+        assert load_city_graphs([]) == {}
+
+
+class TestGraphStats:
+    """Test the memoized get_graph_stats."""
+
+    def test_stats(self):
+        """Counts and graph type of a road network."""
+        stats = get_graph_stats(make_graph())
+
+        assert stats == {
+            'num_nodes': 3,
+            'num_edges': 2,
+            'graph_type': 'MultiDiGraph',
+            'is_directed': True,
+            'is_multigraph': True,
+        }
+
+    def test_stats_are_memoized_until_marked_dirty(self):
+        """Counts are reused until graph.graph['_stats_dirty'] is set."""
+        G = make_graph()
+        get_graph_stats(G)['num_edges'] = 0
+
+        G.add_edge(3, 1, length=1000.0)
+        assert get_graph_stats(G)['num_edges'] == 2
+
+        G.graph['_stats_dirty'] = True
+        assert get_graph_stats(G)['num_edges'] == 3
+        assert '_stats_dirty' not in G.graph
+
+    def test_rejects_non_graphs(self):
+        """Anything but a NetworkX graph raises TypeError."""
+        with pytest.raises(TypeError):
+            get_graph_stats({1: [2]})
+
+
+class TestPrintGraphInfo:
+    """Test the printed graph report."""
+
+    def test_report(self, capsys):
+        """Counts, type and direction are printed under the city title."""
+        print_graph_info(make_graph(), "Kadıköy, Istanbul")
+
+        out = capsys.readouterr().out
+        assert "Road Network: Kadıköy, Istanbul" in out
+        assert "Nodes (Intersections): 3" in out
+        assert "Edges (Road Segments): 2" in out
+        assert "Graph Type: MultiDiGraph" in out
+        assert "Directed: Yes" in out
+
+    def test_precomputed_stats_are_used(self, capsys, monkeypatch):
+        """Passing stats skips get_graph_stats."""
+        G = make_graph()
+        stats = get_graph_stats(G)
+
+        def fail(graph):
+            raise AssertionError("stats should not be recomputed")
+
+        monkeypatch.setattr(simple_graph_loader, 'get_graph_stats', fail)
+        print_graph_info(G, "Kadıköy", {**stats, 'num_nodes': 12453})
+
+        assert "Nodes (Intersections): 12,453" in capsys.readouterr().out
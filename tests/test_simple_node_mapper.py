@@ -0,0 +1,123 @@
+"""
+Unit tests for worldcar.simple_node_mapper module.
+"""
+
+import pytest
+import networkx as nx
+
+from worldcar.simple_node_mapper import (
+    find_nearest_node,
+    batch_find_nearest_nodes,
+    get_node_coordinates,
+    get_nodes_coordinates,
+    validate_coordinates,
+    validate_coordinates_batch,
+)
+
+
+@pytest.fixture
+def graph():
+    """Small grid of intersections in Kadıköy."""
+    G = nx.MultiDiGraph()
+    G.add_node(1, y=40.9800, x=29.0200)
+    G.add_node(2, y=40.9800, x=29.0300)
+    G.add_node(3, y=40.9900, x=29.0200)
+    G.add_node(4, y=40.9900, x=29.0300)
+    G.add_edge(1, 2, length=840.0)
+    G.add_edge(3, 4, length=840.0)
+    return G
+
+
+class TestNearestNode:
+    """Test coordinate-to-node lookups."""
+
+    def test_find_nearest_node(self, graph):
+        """Point next to a node should map to that node."""
+        assert find_nearest_node(graph, 40.9801, 29.0299) == 2
+        assert find_nearest_node(graph, 40.9899, 29.0201) == 3
+
+    def test_find_nearest_node_invalid(self, graph):
+        """Out-of-range coordinates should raise ValueError."""
+        with pytest.raises(ValueError):
+            find_nearest_node(graph, 91.0, 29.0)
+
+    def test_batch_matches_single(self, graph):
+        """Batch lookup should agree with single lookups."""
+        coords = [(40.9801, 29.0299), (40.9899, 29.0201), (40.9851, 29.0210)]
+        expected = [find_nearest_node(graph, lat, lon) for lat, lon in coords]
+
+        assert batch_find_nearest_nodes(graph, coords) == expected
+
+    def test_tuple_node_ids(self):
+        """Tuple node IDs come back as node IDs, not arrays."""
+        G = nx.relabel_nodes(
+            nx.MultiDiGraph([(1, 2)]), {1: (0, 1), 2: (0, 2)}
+        )
+        G.nodes[(0, 1)].update(y=40.98, x=29.02)
+        G.nodes[(0, 2)].update(y=40.99, x=29.03)
+
+        assert find_nearest_node(G, 40.9801, 29.0201) == (0, 1)
+        assert batch_find_nearest_nodes(G, [(40.9899, 29.0299)]) == [(0, 2)]
+
+    def test_added_node_is_found(self, graph):
+        """The shared coordinate cache picks up nodes added after a lookup."""
+        assert find_nearest_node(graph, 41.0001, 29.0401) == 4
+
+        graph.add_node(5, y=41.0000, x=29.0400)
+        assert find_nearest_node(graph, 41.0001, 29.0401) == 5
+
+    def test_batch_empty(self, graph):
+        """Empty batch should return an empty list."""
+        assert batch_find_nearest_nodes(graph, []) == []
+
+    def test_batch_invalid_reports_index(self, graph):
+        """Invalid coordinate in a batch should report its index."""
+        with pytest.raises(ValueError, match="index 1"):
+            batch_find_nearest_nodes(graph, [(40.98, 29.02), (40.98, 200.0)])
+
+
+class TestNodeCoordinates:
+    """Test node coordinate lookups and validation."""
+
+    def test_get_node_coordinates(self, graph):
+        """Node coordinates should be returned as (lat, lon)."""
+        assert get_node_coordinates(graph, 4) == (40.99, 29.03)
+
+    def test_get_node_coordinates_missing(self, graph):
+        """Unknown node should raise KeyError."""
+        with pytest.raises(KeyError):
+            get_node_coordinates(graph, 99)
+
+    def test_get_nodes_coordinates(self, graph):
+        """Batch lookup should match single-node lookups."""
+        coords = get_nodes_coordinates(graph, [4, 1])
+        assert coords.tolist() == [
+            list(get_node_coordinates(graph, 4)),
+            list(get_node_coordinates(graph, 1)),
+        ]
+
+    def test_get_nodes_coordinates_missing(self, graph):
+        """Unknown node in a batch should raise KeyError."""
+        with pytest.raises(KeyError):
+            get_nodes_coordinates(graph, [1, 99])
+
+    def test_validate_coordinates_nan(self):
+        """NaN coordinates should raise ValueError."""
+        with pytest.raises(ValueError):
+            validate_coordinates(float('nan'), 29.0)
+
+    def test_validate_coordinates_batch(self):
+        """Valid batch should come back as an (n, 2) float array."""
+        coords = validate_coordinates_batch([(40.98, 29.02), (-10, 100)])
+        assert coords.shape == (2, 2)
+        assert coords[1, 1] == 100.0
+
+    @pytest.mark.parametrize("bad", [
+        (float('nan'), 29.0),
+        (40.98, float('inf')),
+        ("40.98", 29.0),
+    ])
+    def test_validate_coordinates_batch_reports_index(self, bad):
+        """First invalid pair should be reported by index."""
+        with pytest.raises(ValueError, match="index 2"):
+            validate_coordinates_batch([(40.98, 29.02), (40.99, 29.03), bad])
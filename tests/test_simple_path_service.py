@@ -0,0 +1,228 @@
+"""
+Unit tests for worldcar.simple_path_service module.
+"""
+
+import importlib.util
+
+import pytest
+import networkx as nx
+
+import worldcar.simple_path_service as simple_path_service
+from worldcar.simple_path_service import (
+    compute_shortest_path,
+    compute_shortest_paths_many,
+    calculate_path_length,
+    clear_path_cache,
+    has_path,
+)
+from worldcar.utils import precompute_min_weight_adj
+
+
+@pytest.fixture
+def graph():
+    """Small road network with parallel edges and a one-way dead end."""
+    G = nx.MultiDiGraph()
+    G.add_node(1, y=40.980, x=29.020)
+    G.add_node(2, y=40.981, x=29.021)
+    G.add_node(3, y=40.982, x=29.023)
+    G.add_node(4, y=40.983, x=29.020)
+    G.add_node(5, y=40.985, x=29.030)
+    G.add_edge(1, 2, length=140.0)
+    G.add_edge(1, 2, length=120.0)  # Parallel edge, shorter
+    G.add_edge(2, 1, length=140.0)
+    G.add_edge(2, 3, length=200.0)
+    G.add_edge(3, 4, length=260.0)
+    G.add_edge(1, 4, length=600.0)
+    G.add_edge(4, 5, length=900.0)
+    return G
+
+
+class TestComputeShortestPath:
+    """Test shortest path computation."""
+
+    def test_shortest_path(self, graph):
+        """Path should follow the cheapest edges, including parallel ones."""
+        result = compute_shortest_path(graph, 1, 5)
+
+        assert result['success'] is True
+        assert result['node_ids'] == [1, 2, 3, 4, 5]
+        assert result['path_length_m'] == pytest.approx(1480.0)
+        assert result['num_nodes'] == 5
+
+    def test_matches_networkx(self, graph):
+        """Path length should match NetworkX Dijkstra for every pair."""
+        for u in graph:
+            for v in graph:
+                result = compute_shortest_path(graph, u, v)
+                if nx.has_path(graph, u, v):
+                    expected = nx.shortest_path_length(graph, u, v, weight='length')
+                    assert result['success'] is True
+                    assert result['path_length_m'] == pytest.approx(expected)
+                else:
+                    assert result['success'] is False
+
+    @pytest.mark.parametrize("method", [
+        "dijkstra",
+        "astar",
+        "bidirectional",
+        pytest.param("igraph", marks=pytest.mark.skipif(
+            importlib.util.find_spec("igraph") is None,
+            reason="python-igraph not installed",
+        )),
+    ])
+    def test_methods_agree(self, graph, method):
+        """All search methods should find the same shortest path."""
+        result = compute_shortest_path(graph, 1, 5, method=method)
+
+        assert result['success'] is True
+        assert result['node_ids'] == [1, 2, 3, 4, 5]
+
+    def test_unknown_method(self, graph):
+        """Unknown method should raise ValueError."""
+        with pytest.raises(ValueError):
+            compute_shortest_path(graph, 1, 5, method="bfs")
+
+    def test_no_path(self, graph):
+        """Unreachable target should return an unsuccessful result."""
+        result = compute_shortest_path(graph, 5, 1)
+
+        assert result['success'] is False
+        assert result['node_ids'] == []
+
+    def test_same_node(self, graph):
+        """Identical start and end should return a single-node path."""
+        result = compute_shortest_path(graph, 3, 3)
+
+        assert result['success'] is True
+        assert result['node_ids'] == [3]
+        assert result['path_length_m'] == 0.0
+
+    def test_missing_node(self, graph):
+        """Unknown start node should raise ValueError."""
+        with pytest.raises(ValueError):
+            compute_shortest_path(graph, 99, 1)
+
+
+class TestPathUtilities:
+    """Test path length and reachability helpers."""
+
+    def test_calculate_path_length_uses_min_parallel_edge(self, graph):
+        """Parallel edges should contribute their minimum length."""
+        assert calculate_path_length(graph, [1, 2, 3]) == pytest.approx(320.0)
+
+    def test_min_length_table_is_not_a_graph_attribute(self, graph):
+        """Length table is cached off the graph, so copies and saves skip it."""
+        calculate_path_length(graph, [1, 2])
+
+        adj = precompute_min_weight_adj(graph, default=float('inf'))
+        assert adj[1][2] == pytest.approx(120.0)
+        assert all(not key.startswith('_') for key in graph.graph)
+
+    def test_calculate_path_length_single_node(self, graph):
+        """Single-node path should have zero length."""
+        assert calculate_path_length(graph, [1]) == 0.0
+
+    def test_has_path(self, graph):
+        """Reachability should respect edge direction."""
+        assert has_path(graph, 1, 5) is True
+        assert has_path(graph, 5, 1) is False
+        assert has_path(graph, 1, 99) is False
+
+    def test_has_path_undirected(self):
+        """Undirected graphs should be reachable within each component."""
+        G = nx.MultiGraph()
+        G.add_edge(1, 2, length=10.0)
+        G.add_edge(2, 3, length=10.0)
+        G.add_edge(4, 5, length=10.0)
+
+        assert has_path(G, 3, 1) is True
+        assert has_path(G, 1, 5) is False
+
+
+class TestComputeShortestPathsMany:
+    """Test batched shortest path computation."""
+
+    def test_matches_single_queries(self, graph):
+        """Batched results should match compute_shortest_path per pair."""
+        starts = [1, 1, 2, 5, 3]
+        ends = [5, 3, 4, 1, 3]
+
+        results = compute_shortest_paths_many(graph, starts, ends)
+
+        assert len(results) == len(starts)
+        for start, end, result in zip(starts, ends, results):
+            expected = compute_shortest_path(graph, start, end)
+            assert result['success'] == expected['success']
+            assert result['node_ids'] == expected['node_ids']
+            assert result['path_length_m'] == pytest.approx(expected['path_length_m'])
+
+    def test_small_memory_budget_solves_one_start_per_call(self, graph, monkeypatch):
+        """A budget below one row still solves every start, one at a time."""
+        starts, ends = [1, 2, 3], [5, 4, 5]
+        expected = compute_shortest_paths_many(graph, starts, ends)
+
+        monkeypatch.setattr(simple_path_service, 'MANY_SOURCES_MEMORY_BUDGET', 1)
+        results = compute_shortest_paths_many(graph, starts, ends)
+
+        assert [r['node_ids'] for r in results] == [r['node_ids'] for r in expected]
+
+    def test_mismatched_lengths(self, graph):
+        """Different numbers of starts and ends should raise ValueError."""
+        with pytest.raises(ValueError):
+            compute_shortest_paths_many(graph, [1, 2], [3])
+
+
+class TestBuildCsr:
+    """Test the cached CSR adjacency."""
+
+    def test_edge_count_overflowing_int32_is_rejected(self):
+        """Edge totals past int32 raise before any index is narrowed."""
+
+        class HugeNeighbors(dict):
+            def __len__(self):
+                return 2**30
+
+        G = nx.DiGraph()
+        G.add_nodes_from([1, 2])
+        G._adj = G._succ = {1: HugeNeighbors(), 2: HugeNeighbors()}
+
+        with pytest.raises(ValueError, match="too large for int32"):
+            simple_path_service._build_csr(G)
+
+
+class TestPathCache:
+    """Test caching of computed paths."""
+
+    def test_repeat_query_returns_independent_copy(self, graph):
+        """Cached results should not share mutable state with callers."""
+        first = compute_shortest_path(graph, 1, 5)
+        first['node_ids'].append(99)
+
+        second = compute_shortest_path(graph, 1, 5)
+        assert second['node_ids'] == [1, 2, 3, 4, 5]
+
+    def test_clear_path_cache_after_mutation(self, graph):
+        """Clearing the cache should expose graph changes."""
+        assert compute_shortest_path(graph, 1, 5)['success'] is True
+
+        graph.remove_edge(4, 5)
+        clear_path_cache(graph)
+
+        assert compute_shortest_path(graph, 1, 5)['success'] is False
+
+    @pytest.mark.parametrize("method", ["dijkstra", "astar"])
+    def test_caches_follow_added_edges_and_nodes(self, graph, method):
+        """Added nodes are picked up; added edges after clear_path_cache."""
+        assert compute_shortest_path(graph, 5, 1, method=method)['success'] is False
+
+        graph.add_edge(5, 1, length=50.0)
+        clear_path_cache(graph)
+        result = compute_shortest_path(graph, 5, 1, method=method)
+        assert result['node_ids'] == [5, 1]
+        assert result['path_length_m'] == pytest.approx(50.0)
+
+        graph.add_node(6, y=40.986, x=29.031)
+        assert has_path(graph, 1, 6) is False
+        graph.add_edge(5, 6, length=100.0)
+        clear_path_cache(graph)
+        assert has_path(graph, 1, 6) is True
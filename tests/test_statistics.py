@@ -0,0 +1,309 @@
+"""
+Unit tests for worldcar.statistics module.
+"""
+
+import json
+import pickle
+from collections.abc import Mapping
+
+import pytest
+import networkx as nx
+import numpy as np
+
+import worldcar.statistics as statistics
+from worldcar.statistics import (
+    compute_graph_statistics,
+    compute_graph_statistics_many,
+    analyze_connectivity,
+    clear_statistics_cache,
+    get_degree_statistics,
+    summarize_graph,
+)
+
+
+@pytest.fixture
+def graph():
+    """Two road components plus an isolated intersection."""
+    G = nx.MultiDiGraph()
+    G.add_node(1, y=40.98, x=29.02)
+    G.add_node(2, y=40.99, x=29.02)
+    G.add_node(3, y=40.99, x=29.03)
+    G.add_node(4, y=40.95, x=29.05)
+    G.add_node(5, y=40.96, x=29.05)
+    G.add_node(6, y=40.97, x=29.00)
+
+    G.add_edge(1, 2, length=100.0)
+    G.add_edge(2, 1, length=100.0)
+    G.add_edge(2, 3, length=150.0)
+    G.add_edge(4, 5, length=50.0)
+    return G
+
+
+class TestGraphStatistics:
+    """Test compute_graph_statistics."""
+
+    def test_counts_and_lengths(self, graph):
+        """Basic counts and edge length statistics."""
+        stats = compute_graph_statistics(graph)
+
+        assert stats['num_nodes'] == 6
+        assert stats['num_edges'] == 4
+        assert stats['total_length_m'] == pytest.approx(400.0)
+        assert stats['min_edge_length_m'] == pytest.approx(50.0)
+        assert stats['max_edge_length_m'] == pytest.approx(150.0)
+
+    def test_components(self, graph):
+        """Weakly connected components and largest component share."""
+        stats = compute_graph_statistics(graph)
+
+        assert stats['num_connected_components'] == 3
+        assert stats['largest_component_size'] == 3
+        assert stats['largest_component_pct'] == pytest.approx(50.0)
+
+    def test_record_reads_like_a_dict(self, graph):
+        """Fields read by attribute and through the Mapping API."""
+        stats = compute_graph_statistics(graph)
+
+        assert isinstance(stats, Mapping)
+        assert not hasattr(stats, '__dict__')
+        assert stats.num_nodes == stats['num_nodes'] == 6
+        assert stats.get('missing') is None
+        assert 'bounding_box' in stats and 'missing' not in stats
+        assert dict(stats.items()) == stats.to_dict() == stats
+        with pytest.raises(KeyError):
+            stats['missing']
+
+    def test_record_serializes(self, graph):
+        """to_dict() feeds json; pickling keeps every field."""
+        stats = compute_graph_statistics(graph)
+
+        assert json.loads(json.dumps(stats.to_dict())) == stats
+
+        restored = pickle.loads(pickle.dumps(stats))
+        graph.add_edge(3, 6, length=25.0)
+        assert restored.num_connected_components == 3
+        assert restored == stats.to_dict()
+
+    def test_component_fields_are_lazy(self, graph, monkeypatch):
+        """The component search runs on first access, once per cached result."""
+        calls = []
+        original = statistics._iter_component_sizes
+
+        def record(G, backend=None):
+            calls.append(backend)
+            return original(G, backend)
+
+        monkeypatch.setattr(statistics, '_iter_component_sizes', record)
+        stats = compute_graph_statistics(graph)
+        assert calls == []
+
+        assert stats.num_connected_components == 3
+        assert compute_graph_statistics(graph).largest_component_size == 3
+        assert calls == [None]
+
+    def test_lazy_field_on_mutated_graph_raises(self, graph):
+        """A record never mixes values from before and after a mutation."""
+        stats = compute_graph_statistics(graph)
+        graph.add_edge(3, 6, length=25.0)
+
+        with pytest.raises(RuntimeError, match="changed"):
+            stats.num_connected_components
+
+    def test_network_density(self, graph):
+        """Directed and undirected density, and the trivial cases."""
+        assert compute_graph_statistics(graph)['network_density'] == pytest.approx(4 / 30)
+        assert compute_graph_statistics(nx.path_graph(4))['network_density'] == 0.5
+        assert compute_graph_statistics(nx.empty_graph(3))['network_density'] == 0.0
+
+    def test_many_matches_single(self, graph):
+        """Batch results match per-graph results, in input order."""
+        path = nx.path_graph(4, create_using=nx.MultiDiGraph)
+
+        stats = compute_graph_statistics_many([graph, path])
+
+        assert [s['num_nodes'] for s in stats] == [6, 4]
+        assert stats[0] == compute_graph_statistics(graph)
+
+    def test_many_uses_processes_by_default(self, graph, monkeypatch):
+        """Several graphs go to loky on all cores; one graph stays serial."""
+        calls = []
+
+        class FakeJoblib:
+            @staticmethod
+            def Parallel(n_jobs, backend):
+                calls.append((n_jobs, backend))
+                return list
+
+            @staticmethod
+            def delayed(func):
+                return lambda *args: func(*args)
+
+        monkeypatch.setattr(statistics, 'joblib', FakeJoblib)
+        path = nx.path_graph(4, create_using=nx.MultiDiGraph)
+
+        compute_graph_statistics_many([graph])
+        compute_graph_statistics_many([graph, path], n_jobs=1)
+        assert calls == []
+
+        compute_graph_statistics_many([graph, path])
+        assert calls == [(-1, "loky")]
+
+    def test_many_parallel_matches_serial(self, graph):
+        """Worker processes return the same records as the serial loop."""
+        pytest.importorskip("joblib")
+        path = nx.path_graph(4, create_using=nx.MultiDiGraph)
+
+        serial = compute_graph_statistics_many([graph, path], n_jobs=1)
+        parallel = compute_graph_statistics_many([graph, path], n_jobs=2)
+
+        assert parallel == serial
+        assert parallel[0].num_connected_components == 3
+
+    def test_summary_skips_component_search(self, graph, monkeypatch):
+        """A summary never runs the component search."""
+        def fail(*args, **kwargs):
+            raise AssertionError("component search should not run")
+
+        monkeypatch.setattr(statistics, '_iter_component_sizes', fail)
+        assert summarize_graph(graph).startswith("Road network: 6 nodes")
+
+    def test_results_are_cached_per_backend(self, graph, monkeypatch):
+        """A result computed with one backend is not reused for another."""
+        used = []
+        original = statistics._iter_component_sizes
+
+        def record(G, backend=None):
+            used.append(backend)
+            return original(G, backend)
+
+        monkeypatch.setattr(statistics, '_iter_component_sizes', record)
+        for backend in (None, "networkx", "networkx"):
+            compute_graph_statistics(graph, backend).num_connected_components
+
+        assert used == [None, "networkx"]
+
+    def test_bounding_box(self, graph):
+        """Bounding box covers all nodes."""
+        bbox = compute_graph_statistics(graph)['bounding_box']
+
+        assert bbox == {'north': 40.99, 'south': 40.95, 'east': 29.05, 'west': 29.00}
+
+
+class TestConnectivity:
+    """Test analyze_connectivity."""
+
+    def test_analyze_connectivity(self, graph):
+        """Component sizes are sorted and isolated nodes counted."""
+        conn = analyze_connectivity(graph)
+
+        assert conn['is_connected'] is False
+        assert conn['num_components'] == 3
+        assert conn['component_sizes'] == [3, 2, 1]
+        assert conn['largest_component_size'] == 3
+        assert conn['isolated_nodes'] == 1
+
+    def test_connected_graph(self):
+        """A single component is connected."""
+        G = nx.path_graph(4)
+        assert analyze_connectivity(G)['is_connected'] is True
+
+    def test_explicit_networkx_backend(self, graph):
+        """Passing the reference backend gives the same result."""
+        conn = analyze_connectivity(graph, backend="networkx")
+        assert conn['component_sizes'] == [3, 2, 1]
+
+    def test_unsupported_backend_falls_back_to_networkx(self, graph, monkeypatch):
+        """A backend that rejects the graph type is skipped, not fatal."""
+        original = nx.weakly_connected_components
+
+        def components(G, backend=None):
+            if backend not in (None, "networkx"):
+                raise NotImplementedError(f"'{backend}' does not support MultiDiGraph")
+            return original(G)
+
+        monkeypatch.setattr(nx, 'weakly_connected_components', components)
+
+        conn = analyze_connectivity(graph, backend="cugraph")
+        assert conn['component_sizes'] == [3, 2, 1]
+
+    def test_sink_node_is_not_isolated(self):
+        """A node with only incoming edges still has degree > 0."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2)
+        G.add_node(3)
+        assert analyze_connectivity(G)['isolated_nodes'] == 1
+        assert analyze_connectivity(nx.Graph(G))['isolated_nodes'] == 1
+
+
+class TestDegreeStatistics:
+    """Test get_degree_statistics."""
+
+    def test_degree_statistics(self, graph):
+        """Degree summary over in+out degrees."""
+        deg = get_degree_statistics(graph)
+
+        assert deg['min_degree'] == 0
+        assert deg['max_degree'] == 3
+        assert deg['median_degree'] == pytest.approx(1.0)
+        assert deg['degree_distribution'] == {0: 1, 1: 3, 2: 1, 3: 1}
+
+    @pytest.mark.parametrize("num_nodes", [5, 6])
+    def test_median_matches_numpy(self, num_nodes):
+        """Histogram median agrees with np.median for odd and even counts."""
+        G = nx.MultiDiGraph(nx.star_graph(num_nodes - 1))
+        G.add_edge(1, 2)
+        degrees = [degree for _, degree in G.degree()]
+
+        deg = get_degree_statistics(G)
+
+        assert deg['median_degree'] == pytest.approx(float(np.median(degrees)))
+
+    def test_parallel_edges_and_self_loops_match_networkx(self):
+        """Degrees read from the adjacency agree with G.degree()."""
+        G = nx.MultiDiGraph()
+        G.add_edges_from([(1, 2), (1, 2), (2, 1), (2, 2), (3, 1)])
+        expected = [degree for _, degree in G.degree()]
+
+        deg = get_degree_statistics(G)
+
+        assert deg['max_degree'] == max(expected)
+        assert deg['degree_distribution'] == {
+            degree: expected.count(degree) for degree in set(expected)
+        }
+
+    def test_empty_graph(self):
+        """Empty graph yields zeroed statistics."""
+        deg = get_degree_statistics(nx.MultiDiGraph())
+        assert deg['avg_degree'] == 0.0
+        assert deg['degree_distribution'] == {}
+
+
+class TestStatisticsCache:
+    """Test memoization of graph statistics."""
+
+    def test_mutation_changing_counts_recomputes(self, graph):
+        """Adding an edge changes the version tag and the result."""
+        assert compute_graph_statistics(graph)['num_edges'] == 4
+
+        graph.add_edge(3, 6, length=25.0)
+
+        stats = compute_graph_statistics(graph)
+        assert stats['num_edges'] == 5
+        assert stats['total_length_m'] == pytest.approx(425.0)
+
+    def test_clear_statistics_cache(self, graph):
+        """Same-size mutations are picked up after clearing the cache."""
+        compute_graph_statistics(graph)
+        graph.edges[4, 5, 0]['length'] = 80.0
+        graph.nodes[6]['x'] = 28.90
+
+        clear_statistics_cache(graph)
+
+        stats = compute_graph_statistics(graph)
+        assert stats['total_length_m'] == pytest.approx(430.0)
+        assert stats['bounding_box']['west'] == 28.90
+
+    def test_cached_result_is_a_copy(self, graph):
+        """Mutating a returned dict does not affect later calls."""
+        compute_graph_statistics(graph)['bounding_box']['north'] = 0.0
+        assert compute_graph_statistics(graph)['bounding_box']['north'] == 40.99
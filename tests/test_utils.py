@@ -4,16 +4,27 @@ Unit tests for worldcar.utils module.
 
 import pytest
 import networkx as nx
+import numpy as np
 
+import worldcar.utils as utils
 from worldcar.utils import (
     haversine_distance,
+    haversine_distance_batch,
+    haversine_matrix,
+    euclidean_distance,
+    euclidean_distance_batch,
     validate_coordinates,
+    coordinates_valid_mask,
     validate_coordinate_pair,
     validate_graph,
     get_bounding_box,
+    get_coordinate_arrays,
+    graph_version,
     format_distance,
     format_coordinates,
+    format_time,
     compute_path_total_length,
+    precompute_min_weight_adj,
     meters_to_km,
     km_to_meters,
 )
@@ -39,6 +50,67 @@ class TestDistanceCalculations:
         dist2 = haversine_distance(40.9638, 29.0408, 40.9856, 29.0298)
         assert abs(dist1 - dist2) < 0.01  # Should be essentially equal
 
+    def test_haversine_distance_batch_matches_scalar(self):
+        """Batch distances should match the scalar function."""
+        lats = np.array([40.9856, 40.9700, 41.0100])
+        lons = np.array([29.0298, 29.0300, 28.9800])
+
+        dists = haversine_distance_batch(lats, lons, 40.9638, 29.0408)
+
+        expected = [haversine_distance(lat, lon, 40.9638, 29.0408)
+                    for lat, lon in zip(lats, lons)]
+        assert dists == pytest.approx(expected)
+
+    def test_haversine_matrix_matches_scalar(self):
+        """Every OD matrix entry should match the scalar function."""
+        lats = np.array([40.9856, 40.9700, 41.0100])
+        lons = np.array([29.0298, 29.0300, 28.9800])
+
+        matrix = haversine_matrix(lats, lons, lats[:2], lons[:2])
+
+        assert matrix.shape == (3, 2)
+        for i in range(3):
+            for j in range(2):
+                assert matrix[i, j] == pytest.approx(
+                    haversine_distance(lats[i], lons[i], lats[j], lons[j]),
+                    abs=1e-6,
+                )
+
+    def test_haversine_matrix_methods_agree(self):
+        """Installed backends match the default; unknown methods raise."""
+        lats = np.array([40.9856, 40.9700, 41.0100])
+        lons = np.array([29.0298, 29.0300, 28.9800])
+
+        expected = haversine_matrix(lats, lons, lats, lons)
+        methods = ["numpy"]
+        if utils.njit is not None:
+            methods.append("numba")
+        for method in methods:
+            assert haversine_matrix(lats, lons, lats, lons, method=method) == (
+                pytest.approx(expected, abs=1e-6)
+            )
+        with pytest.raises(ValueError):
+            haversine_matrix(lats, lons, lats, lons, method="sleef")
+
+    def test_haversine_matrix_missing_backend(self, monkeypatch):
+        """Asking for an uninstalled backend raises; auto falls back to NumPy."""
+        monkeypatch.setattr(utils, 'numexpr', None)
+        lats = np.array([40.9856, 40.9638])
+        lons = np.array([29.0298, 29.0408])
+
+        with pytest.raises(ValueError, match="numexpr"):
+            haversine_matrix(lats, lons, lats, lons, method="numexpr")
+        assert haversine_matrix(lats, lons, lats, lons)[0, 1] == pytest.approx(
+            haversine_distance(lats[0], lons[0], lats[1], lons[1])
+        )
+
+    def test_euclidean_distance(self):
+        """3-4-5 triangle, scalar and batch."""
+        assert euclidean_distance(0, 0, 3, 4) == 5.0
+        assert euclidean_distance_batch(
+            np.array([0.0, 1.0]), np.array([0.0, 1.0]), 3.0, 4.0
+        ).tolist() == pytest.approx([5.0, 3.605551275])
+
 
 class TestCoordinateValidation:
     """Test coordinate validation functions."""
@@ -69,6 +141,18 @@ class TestCoordinateValidation:
         assert validate_coordinates(float('inf'), 29.0) is False
         assert validate_coordinates(40.0, float('-inf')) is False
 
+    def test_coordinates_valid_mask(self):
+        """Batch validation should agree with the scalar validator."""
+        lats = np.array([40.9856, 91.0, float('nan'), 40.0, -90.0])
+        lons = np.array([29.0298, 29.0, 29.0, float('inf'), 180.0])
+
+        valid = coordinates_valid_mask(lats, lons)
+
+        assert valid.tolist() == [
+            validate_coordinates(lat, lon) for lat, lon in zip(lats.tolist(), lons.tolist())
+        ]
+        assert valid.tolist() == [True, False, False, False, True]
+
     def test_validate_coordinate_pair_valid(self):
         """Valid coordinate pair should pass validation."""
         origin = (40.9856, 29.0298)
@@ -147,6 +231,41 @@ class TestGraphAnalysis:
         assert bbox['east'] == 30.0
         assert bbox['west'] == 29.0
 
+    def test_get_bounding_box_missing_coordinates(self):
+        """A node without coordinates is reported by ID."""
+        G = nx.MultiDiGraph()
+        G.add_node(1, y=40.0, x=29.0)
+        G.add_node(2, y=41.0)
+
+        with pytest.raises(ValueError, match="Node 2"):
+            get_bounding_box(G)
+
+    def test_get_coordinate_arrays(self):
+        """Coordinate arrays line up with the index and track added nodes."""
+        G = nx.MultiDiGraph()
+        G.add_node('a', y=40.0, x=29.0)
+        G.add_node('b', y=41.0, x=30.0)
+
+        lats, lons, index = get_coordinate_arrays(G)
+        assert (lats[index['b']], lons[index['b']]) == (41.0, 30.0)
+
+        G.add_node('c', y=42.0, x=31.0)
+        lats, _, index = get_coordinate_arrays(G)
+        assert lats[index['c']] == 42.0
+        assert get_bounding_box(G)['north'] == 42.0
+
+    def test_graph_version_tracks_nodes(self):
+        """Version is the node count, unaffected by edges between known nodes."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, length=10.0)
+        assert graph_version(G) == 2
+
+        G.add_edge(2, 1, length=5.0)
+        assert graph_version(G) == 2
+
+        G.add_edge(2, 3)
+        assert graph_version(G) == 3
+
 
 class TestFormatting:
     """Test formatting functions."""
@@ -166,6 +285,12 @@ class TestFormatting:
         assert "40.985600" in result
         assert "29.029800" in result
 
+    def test_format_time(self):
+        """Seconds, minutes and hours pick their own unit."""
+        assert format_time(45) == "45.00 s"
+        assert format_time(125) == "2.08 min"
+        assert format_time(5400) == "1.50 h"
+
     def test_meters_to_km(self):
         """Test meter to kilometer conversion."""
         assert meters_to_km(1000) == 1.0
@@ -203,3 +328,23 @@ class TestPathUtilities:
         length = compute_path_total_length(G, path)
 
         assert length == 0.0
+
+    def test_compute_path_total_length_parallel_edges(self):
+        """Parallel edges should contribute their minimum length."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, length=1000)
+        G.add_edge(1, 2, length=800)
+        G.add_edge(1, 2)
+        G.add_edge(2, 3, length=1500)
+
+        assert compute_path_total_length(G, [1, 2, 3]) == 2300.0
+        assert precompute_min_weight_adj(G)[1][2] == 800
+
+    def test_compute_path_total_length_unweighted_hop_counts_zero(self):
+        """A hop whose parallel edges all lack the weight adds 0.0."""
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2)
+        G.add_edge(1, 2)
+        G.add_edge(2, 3, length=5.0)
+
+        assert compute_path_total_length(G, [1, 2, 3]) == 5.0
@@ -31,6 +31,11 @@ DEFAULT_LOCATION = "Kadıköy, Istanbul, Turkey"
 # 'drive' includes only roads accessible by cars
 NETWORK_TYPE = "drive"
 
+# Optional bounding box for DEFAULT_LOCATION as (north, south, east, west)
+# in decimal degrees. When set, the network is downloaded with a direct
+# Overpass bbox query instead of geocoding the place name via Nominatim.
+DEFAULT_BBOX = None
+
 # ============================================================================
 # Graph Settings
 # ============================================================================
@@ -70,6 +75,10 @@ KDTREE_ENABLED = True
 # Coordinates further than this from any road will be rejected
 MAX_SEARCH_RADIUS_METERS = 500
 
+# Graphs spanning less than this many degrees in both latitude and longitude
+# are indexed in a local UTM plane (meters) instead of raw lat/lon degrees
+PROJECTION_MAX_SPAN_DEGREES = 1.0
+
 # ============================================================================
 # Coordinate System
 # ============================================================================
@@ -101,6 +110,13 @@ ENABLE_PERFORMANCE_LOGGING = False
 # Timeout for OSM data download (seconds)
 DOWNLOAD_TIMEOUT = 180
 
+# joblib backend and worker count for compute_graph_statistics_many().
+# The statistics are pure-Python NetworkX work that holds the GIL, so a
+# process backend ("loky") is needed for a speedup; each graph is pickled
+# to a worker. n_jobs = -1 uses all CPU cores, 1 runs serially.
+STATS_PARALLEL_BACKEND = "loky"
+STATS_PARALLEL_N_JOBS = -1
+
 # ============================================================================
 # Validation Settings
 # ============================================================================
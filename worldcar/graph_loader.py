@@ -7,7 +7,8 @@ creating NetworkX graphs, and managing graph caching for efficient repeated use.
 
 import os
 import logging
-from typing import Optional
+import functools
+from typing import Optional, Tuple
 from pathlib import Path
 
 import osmnx as ox
@@ -15,6 +16,7 @@ import networkx as nx
 
 from worldcar.config import (
     DEFAULT_LOCATION,
+    DEFAULT_BBOX,
     NETWORK_TYPE,
     SIMPLIFY_GRAPH,
     RETAIN_ALL_NODES,
@@ -35,6 +37,49 @@ ox.settings.use_cache = True
 ox.settings.cache_folder = CACHE_DIRECTORY
 
 
+@functools.lru_cache(maxsize=4)
+def _load_cached(filepath: str, mtime: float) -> nx.MultiDiGraph:
+    """
+    Load a GraphML file, memoized process-wide.
+
+    The file's modification time is part of the cache key, so overwriting
+    the file (e.g. via GraphLoader.save_graph) automatically invalidates
+    the cached graph. The returned graph is shared between callers and must
+    not be modified; GraphLoader.load_from_cache() hands out copies.
+
+    Args:
+        filepath: Path to GraphML file
+        mtime: Modification time of the file (from os.path.getmtime)
+
+    Returns:
+        NetworkX MultiDiGraph loaded from disk
+    """
+    return ox.load_graphml(filepath)
+
+
+def _graph_from_bbox(
+    bbox: Tuple[float, float, float, float],
+    **kwargs
+) -> nx.MultiDiGraph:
+    """
+    Call ox.graph_from_bbox with the argument order of the installed OSMnx.
+
+    OSMnx 2.x takes a single (west, south, east, north) tuple, while 1.x
+    takes north, south, east and west as separate arguments.
+
+    Args:
+        bbox: (north, south, east, west) bounding box
+        **kwargs: Keyword arguments passed through to ox.graph_from_bbox
+
+    Returns:
+        NetworkX MultiDiGraph with road network data
+    """
+    north, south, east, west = bbox
+    if int(ox.__version__.split('.')[0]) >= 2:
+        return ox.graph_from_bbox((west, south, east, north), **kwargs)
+    return ox.graph_from_bbox(north, south, east, west, **kwargs)
+
+
 class GraphLoader:
     """
     Handles OSM data extraction and graph creation.
@@ -46,6 +91,8 @@ class GraphLoader:
         location (str): Geographic location to extract (e.g., "Kadıköy, Istanbul, Turkey")
         network_type (str): Type of road network ('drive', 'walk', 'bike', 'all')
         simplify (bool): Whether to simplify the graph by removing non-junction nodes
+        bbox (tuple or None): (north, south, east, west) bounding box used instead
+            of geocoding the location, if known
         graph (nx.MultiDiGraph): The loaded or downloaded graph
 
     Example:
@@ -60,6 +107,7 @@ class GraphLoader:
         location: str = DEFAULT_LOCATION,
         network_type: str = NETWORK_TYPE,
         simplify: bool = SIMPLIFY_GRAPH,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
     ):
         """
         Initialize the GraphLoader.
@@ -68,12 +116,24 @@ class GraphLoader:
             location: Geographic location (place name, address, or coordinates)
             network_type: Type of network to download ('drive', 'walk', 'bike', 'all')
             simplify: Whether to simplify the graph
+            bbox: Optional (north, south, east, west) bounding box of the
+                location. Defaults to config.DEFAULT_BBOX for DEFAULT_LOCATION.
         """
         self.location = location
         self.network_type = network_type
         self.simplify = simplify
+
+        if bbox is None and location == DEFAULT_LOCATION:
+            bbox = DEFAULT_BBOX
+        self.bbox = bbox
         self.graph: Optional[nx.MultiDiGraph] = None
 
+        # Structural counts of the last prepared graph (see prepare_graph)
+        self._counted_graph: Optional[nx.MultiDiGraph] = None
+        self._nn = 0
+        self._ne = 0
+        self._ncc = 0
+
         logger.info(
             f"GraphLoader initialized for location: {location}, "
             f"network_type: {network_type}, simplify: {simplify}"
@@ -85,6 +145,9 @@ class GraphLoader:
 
         Uses OSMnx to download the road network for the specified location.
         The graph is automatically cached by OSMnx for faster subsequent loads.
+        If a bounding box is known, the network is fetched with a single
+        Overpass bbox query, skipping Nominatim geocoding and polygon
+        clipping; otherwise the place name is geocoded.
 
         Returns:
             NetworkX MultiDiGraph with road network data
@@ -103,13 +166,22 @@ class GraphLoader:
 
         try:
             # Download network from OSM
-            G = ox.graph_from_place(
-                self.location,
-                network_type=self.network_type,
-                simplify=self.simplify,
-                retain_all=RETAIN_ALL_NODES,
-                truncate_by_edge=True,
-            )
+            if self.bbox is not None:
+                G = _graph_from_bbox(
+                    self.bbox,
+                    network_type=self.network_type,
+                    simplify=self.simplify,
+                    retain_all=RETAIN_ALL_NODES,
+                    truncate_by_edge=True,
+                )
+            else:
+                G = ox.graph_from_place(
+                    self.location,
+                    network_type=self.network_type,
+                    simplify=self.simplify,
+                    retain_all=RETAIN_ALL_NODES,
+                    truncate_by_edge=True,
+                )
 
             logger.info(
                 f"Successfully downloaded graph: {G.number_of_nodes()} nodes, "
@@ -167,24 +239,57 @@ class GraphLoader:
             )
             G = ox.add_edge_lengths(G)
 
-        # Verify connectivity
-        if not nx.is_weakly_connected(G):
-            num_components = nx.number_weakly_connected_components(G)
+        # Verify connectivity in a single pass over the components
+        num_components, largest_cc_size = self._count_components(G)
+
+        if num_components > 1:
             logger.warning(
                 f"Graph is not fully connected. "
                 f"It has {num_components} weakly connected components."
             )
-
-            # Get largest connected component
-            largest_cc = max(nx.weakly_connected_components(G), key=len)
             logger.info(
-                f"Largest component has {len(largest_cc)} nodes "
-                f"({len(largest_cc) / G.number_of_nodes() * 100:.1f}% of total)"
+                f"Largest component has {largest_cc_size} nodes "
+                f"({largest_cc_size / G.number_of_nodes() * 100:.1f}% of total)"
             )
 
+        # Cache structural counts; they don't change after preparation
+        self._record_counts(G, num_components)
+
         logger.info("Graph preparation complete.")
         return G
 
+    @staticmethod
+    def _count_components(G: nx.MultiDiGraph) -> Tuple[int, int]:
+        """
+        Count weakly connected components and the largest component size.
+
+        Args:
+            G: NetworkX graph
+
+        Returns:
+            Tuple of (number of components, size of largest component)
+        """
+        num_components = 0
+        largest_cc_size = 0
+        for component in nx.weakly_connected_components(G):
+            num_components += 1
+            largest_cc_size = max(largest_cc_size, len(component))
+
+        return num_components, largest_cc_size
+
+    def _record_counts(self, G: nx.MultiDiGraph, num_components: int) -> None:
+        """
+        Cache node, edge and component counts for a graph.
+
+        Args:
+            G: NetworkX graph the counts belong to
+            num_components: Number of weakly connected components in G
+        """
+        self._counted_graph = G
+        self._nn = G.number_of_nodes()
+        self._ne = G.number_of_edges()
+        self._ncc = num_components
+
     def save_graph(
         self, G: nx.MultiDiGraph, filepath: Optional[str] = None
     ) -> None:
@@ -227,6 +332,12 @@ class GraphLoader:
         """
         Load previously saved graph from disk.
 
+        Loaded graphs are kept in a small process-wide LRU cache keyed on
+        file path and modification time, so repeated GraphLoader instances
+        (e.g. in web workers) reuse the in-memory graph instead of
+        re-parsing the GraphML file. Each call returns its own copy of the
+        cached graph, so one loader's edits never show up in another's.
+
         Args:
             filepath: Path to GraphML file (default: config.PROCESSED_GRAPH_PATH)
 
@@ -249,7 +360,8 @@ class GraphLoader:
         logger.info(f"Loading cached graph from: {filepath}")
 
         try:
-            G = ox.load_graphml(filepath)
+            mtime = os.path.getmtime(filepath)
+            G = _load_cached(filepath, mtime).copy()
             logger.info(
                 f"Successfully loaded graph: {G.number_of_nodes()} nodes, "
                 f"{G.number_of_edges()} edges"
@@ -323,6 +435,10 @@ class GraphLoader:
         """
         Get basic information about the loaded graph.
 
+        Node, edge and component counts are cached by prepare_graph(), so
+        repeated calls are O(1). Graphs loaded from cache are counted once
+        on first call.
+
         Returns:
             Dictionary with graph statistics
 
@@ -339,16 +455,18 @@ class GraphLoader:
         if self.graph is None:
             raise ValueError("No graph loaded. Call get_or_create_graph() first.")
 
+        if self._counted_graph is not self.graph:
+            num_components, _ = self._count_components(self.graph)
+            self._record_counts(self.graph, num_components)
+
         return {
             'location': self.location,
             'network_type': self.network_type,
-            'num_nodes': self.graph.number_of_nodes(),
-            'num_edges': self.graph.number_of_edges(),
+            'num_nodes': self._nn,
+            'num_edges': self._ne,
             'is_directed': self.graph.is_directed(),
             'is_multigraph': self.graph.is_multigraph(),
-            'num_connected_components': nx.number_weakly_connected_components(
-                self.graph
-            ),
+            'num_connected_components': self._ncc,
         }
 
 
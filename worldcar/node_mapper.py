@@ -3,6 +3,8 @@ Node Mapper Module for WorldCar routing system.
 
 This module provides efficient mapping from geographic coordinates (latitude, longitude)
 to graph nodes using spatial indexing with KDTree for O(log n) nearest neighbor queries.
+City-scale graphs are indexed in a local UTM plane so that KDTree distances are
+already in meters.
 """
 
 import logging
@@ -10,12 +12,20 @@ from typing import Optional, Tuple, Dict, Any
 
 import networkx as nx
 import numpy as np
-from scipy.spatial import KDTree
-
-from worldcar.config import MAX_SEARCH_RADIUS_METERS, KDTREE_ENABLED
+from pyproj import Transformer
+from scipy.spatial import cKDTree
+
+from worldcar.config import (
+    MAX_SEARCH_RADIUS_METERS,
+    KDTREE_ENABLED,
+    DEFAULT_CRS,
+    PROJECTED_CRS,
+    PROJECTION_MAX_SPAN_DEGREES,
+)
 from worldcar.utils import (
     validate_coordinates,
     haversine_distance,
+    haversine_distance_batch,
     format_coordinates,
     format_distance,
 )
@@ -37,7 +47,9 @@ class NodeMapper:
         graph (nx.MultiDiGraph): The road network graph
         node_coords (np.ndarray): Array of (lat, lon) for each node
         node_ids (list): List of node IDs corresponding to node_coords
-        kdtree (KDTree): Spatial index for fast nearest neighbor queries
+        kdtree (cKDTree): Spatial index for fast nearest neighbor queries
+        projected_crs (str or None): CRS of the metric plane the KDTree is
+            built in, or None if the KDTree indexes raw (lat, lon) degrees
 
     Example:
         >>> mapper = NodeMapper(G)
@@ -63,7 +75,9 @@ class NodeMapper:
         self.graph = G
         self.node_coords: Optional[np.ndarray] = None
         self.node_ids: Optional[list] = None
-        self.kdtree: Optional[KDTree] = None
+        self.kdtree: Optional[cKDTree] = None
+        self.projected_crs: Optional[str] = None
+        self._transformer: Optional[Transformer] = None
 
         if G.number_of_nodes() == 0:
             raise ValueError("Cannot create NodeMapper from empty graph")
@@ -82,43 +96,79 @@ class NodeMapper:
         Build KDTree spatial index for fast nearest neighbor search.
 
         Extracts coordinates from all nodes and constructs a KDTree
-        for efficient O(log n) nearest neighbor queries.
+        for efficient O(log n) nearest neighbor queries. If the graph spans
+        less than PROJECTION_MAX_SPAN_DEGREES in each axis, node coordinates
+        are projected once to a local UTM plane so the KDTree is built on
+        meters and query distances need no Haversine post-processing.
 
         Raises:
             ValueError: If nodes are missing coordinate attributes
         """
         logger.info("Building spatial index...")
 
-        # Extract node IDs and coordinates
-        node_ids = []
-        node_coords = []
-
-        for node_id, data in self.graph.nodes(data=True):
-            if 'y' not in data or 'x' not in data:
-                raise ValueError(
-                    f"Node {node_id} missing coordinate attributes (x, y)"
-                )
+        # Extract node IDs and coordinates in bulk
+        xs_map = nx.get_node_attributes(self.graph, 'x')
+        ys_map = nx.get_node_attributes(self.graph, 'y')
 
-            lat = data['y']
-            lon = data['x']
+        num_nodes = self.graph.number_of_nodes()
+        if len(xs_map) != num_nodes or len(ys_map) != num_nodes:
+            missing = next(
+                node_id for node_id in self.graph
+                if node_id not in xs_map or node_id not in ys_map
+            )
+            raise ValueError(
+                f"Node {missing} missing coordinate attributes (x, y)"
+            )
 
-            node_ids.append(node_id)
-            node_coords.append([lat, lon])
+        node_ids = list(xs_map)
+        lats = np.fromiter(
+            (ys_map[node_id] for node_id in node_ids),
+            dtype=np.float64,
+            count=num_nodes,
+        )
+        lons = np.fromiter(
+            (xs_map[node_id] for node_id in node_ids),
+            dtype=np.float64,
+            count=num_nodes,
+        )
 
-        # Convert to numpy arrays
+        # cKDTree always indexes float64 data and shares a C-contiguous
+        # float64 array instead of copying it; a float32 array would be
+        # upcast into a second buffer, doubling index memory.
         self.node_ids = node_ids
-        self.node_coords = np.array(node_coords)
+        self.node_coords = np.column_stack((lats, lons))
 
         # Build KDTree for fast nearest neighbor search
         if KDTREE_ENABLED:
-            self.kdtree = KDTree(self.node_coords)
-            logger.info(
-                f"KDTree built successfully with {len(self.node_ids)} nodes"
-            )
+            lat_span = lats.max() - lats.min()
+            lon_span = lons.max() - lons.min()
+
+            if (
+                lat_span < PROJECTION_MAX_SPAN_DEGREES
+                and lon_span < PROJECTION_MAX_SPAN_DEGREES
+            ):
+                self.projected_crs = PROJECTED_CRS or _utm_crs_for(
+                    float(lats.mean()), float(lons.mean())
+                )
+                self._transformer = Transformer.from_crs(
+                    DEFAULT_CRS, self.projected_crs, always_xy=True
+                )
+                xs, ys = self._transformer.transform(lons, lats)
+                node_xy = np.ascontiguousarray(
+                    np.column_stack((xs, ys)), dtype=np.float64
+                )
+                self.kdtree = cKDTree(node_xy)
+                logger.info(
+                    f"KDTree built successfully with {len(self.node_ids)} nodes "
+                    f"in projected CRS {self.projected_crs}"
+                )
+            else:
+                self.kdtree = cKDTree(self.node_coords)
+                logger.info(
+                    f"KDTree built successfully with {len(self.node_ids)} nodes"
+                )
         else:
-            logger.info(
-                "KDTree disabled in config. Using brute-force search (slower)."
-            )
+            logger.info("KDTree disabled in config. Using brute force search (slower).")
 
     def find_nearest_node(
         self,
@@ -152,25 +202,26 @@ class NodeMapper:
             logger.warning(f"Invalid coordinates: {format_coordinates(lat, lon)}")
             return None
 
-        query_point = np.array([lat, lon])
+        if KDTREE_ENABLED and self.kdtree is not None and self._transformer is not None:
+            # Projected KDTree: distances are already in meters
+            x, y = self._transformer.transform(lon, lat)
+            distance_meters, index = self.kdtree.query([x, y])
+            node_id = self.node_ids[index]
 
-        if KDTREE_ENABLED and self.kdtree is not None:
+        elif KDTREE_ENABLED and self.kdtree is not None:
             # Use KDTree for fast search
-            distance, index = self.kdtree.query(query_point)
+            distance, index = self.kdtree.query([lat, lon])
 
             # KDTree returns distance in coordinate units (degrees)
             # Convert to meters using Haversine
             nearest_lat, nearest_lon = self.node_coords[index]
             distance_meters = haversine_distance(lat, lon, nearest_lat, nearest_lon)
+            node_id = self.node_ids[index]
 
         else:
             # Brute force search (slower, but works without KDTree)
-            distances = np.array([
-                haversine_distance(lat, lon, node_lat, node_lon)
-                for node_lat, node_lon in self.node_coords
-            ])
-            index = np.argmin(distances)
-            distance_meters = distances[index]
+            index, distance_meters = self._brute_force_nearest(lat, lon)
+            node_id = self.node_ids[index]
 
         # Check if within max distance
         if distance_meters > max_distance:
@@ -181,7 +232,6 @@ class NodeMapper:
             )
             return None
 
-        node_id = self.node_ids[index]
         logger.debug(
             f"Found nearest node {node_id} at {format_distance(distance_meters)}"
         )
@@ -312,6 +362,10 @@ class NodeMapper:
         """
         Find nearest nodes for multiple coordinates efficiently.
 
+        All valid coordinates are sent to the KDTree in a single query with
+        ``workers=-1``, so large batches are spread across all CPU cores.
+        Invalid coordinates map to None.
+
         Args:
             coordinates: List of (latitude, longitude) tuples
             max_distance: Maximum search radius in meters
@@ -328,16 +382,93 @@ class NodeMapper:
         """
         logger.info(f"Batch finding nearest nodes for {len(coordinates)} coordinates")
 
-        results = []
-        for lat, lon in coordinates:
-            node_id = self.find_nearest_node(lat, lon, max_distance)
-            results.append(node_id)
+        results = self._batch_query(coordinates, max_distance)
 
         found = len([n for n in results if n is not None])
         logger.info(f"Found nearest nodes for {found}/{len(coordinates)} coordinates")
 
         return results
 
+    def _batch_query(
+        self,
+        coordinates: list[Tuple[float, float]],
+        max_distance: float,
+    ) -> list[Optional[int]]:
+        """
+        Query the spatial index once for a whole batch of coordinates.
+
+        Without a KDTree each coordinate falls back to a brute force search.
+
+        Args:
+            coordinates: List of (latitude, longitude) tuples
+            max_distance: Maximum search radius in meters
+
+        Returns:
+            List of node IDs (or None if invalid or no node within max_distance)
+        """
+        results: list[Optional[int]] = [None] * len(coordinates)
+
+        valid = []
+        for i, (lat, lon) in enumerate(coordinates):
+            if validate_coordinates(lat, lon):
+                valid.append(i)
+            else:
+                logger.warning(
+                    f"Invalid coordinates: {format_coordinates(lat, lon)}"
+                )
+
+        if not valid:
+            return results
+
+        lats = np.array([coordinates[i][0] for i in valid], dtype=np.float64)
+        lons = np.array([coordinates[i][1] for i in valid], dtype=np.float64)
+
+        if not (KDTREE_ENABLED and self.kdtree is not None):
+            for i, lat, lon in zip(valid, lats, lons):
+                index, distance_meters = self._brute_force_nearest(lat, lon)
+                if distance_meters <= max_distance:
+                    results[i] = self.node_ids[index]
+            return results
+
+        if self._transformer is not None:
+            # Projected KDTree: distances are already in meters
+            xs, ys = self._transformer.transform(lons, lats)
+            distances, indices = self.kdtree.query(
+                np.column_stack((xs, ys)), k=1, workers=-1
+            )
+        else:
+            _, indices = self.kdtree.query(
+                np.column_stack((lats, lons)), k=1, workers=-1
+            )
+            distances = [
+                haversine_distance(lat, lon, node_lat, node_lon)
+                for lat, lon, (node_lat, node_lon)
+                in zip(lats, lons, self.node_coords[indices])
+            ]
+
+        for i, distance_meters, index in zip(valid, distances, indices):
+            if distance_meters <= max_distance:
+                results[i] = self.node_ids[index]
+
+        return results
+
+    def _brute_force_nearest(self, lat: float, lon: float) -> Tuple[int, float]:
+        """
+        Find the nearest node by computing the distance to every node.
+
+        Args:
+            lat: Latitude in decimal degrees
+            lon: Longitude in decimal degrees
+
+        Returns:
+            Tuple of (index into node_ids, distance in meters)
+        """
+        distances = haversine_distance_batch(
+            self.node_coords[:, 0], self.node_coords[:, 1], lat, lon
+        )
+        index = int(np.argmin(distances))
+        return index, float(distances[index])
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the NodeMapper.
@@ -354,10 +485,31 @@ class NodeMapper:
         return {
             'num_nodes': len(self.node_ids) if self.node_ids else 0,
             'kdtree_enabled': KDTREE_ENABLED and self.kdtree is not None,
+            'projected_crs': self.projected_crs,
             'max_search_radius_m': MAX_SEARCH_RADIUS_METERS,
         }
 
 
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def _utm_crs_for(lat: float, lon: float) -> str:
+    """
+    Get the WGS84 UTM zone CRS containing a point.
+
+    Args:
+        lat: Latitude in decimal degrees
+        lon: Longitude in decimal degrees
+
+    Returns:
+        EPSG code string of the UTM zone (e.g. "EPSG:32635" for Istanbul)
+    """
+    zone = min(int((lon + 180) // 6) + 1, 60)
+    base = 32600 if lat >= 0 else 32700
+    return f"EPSG:{base + zone}"
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
@@ -11,12 +11,21 @@ Phase 1 Focus:
 - No routing algorithms (handled in separate module)
 """
 
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
+import weakref
 
 import osmnx as ox
 import networkx as nx
 
+from worldcar.utils import precompute_min_weight_adj
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,8 +33,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default directory for the on-disk graph cache
+DEFAULT_CACHE_DIR = "~/.cache/worldcar"
+
+# Supported on-disk cache formats and their file suffixes
+CACHE_FORMATS = {"pickle": ".pkl", "graphml": ".graphml"}
+
+# Separator line used by print_graph_info()
+_SEP = "=" * 60
+
+# Memoized get_graph_stats() results. Entries disappear together with the
+# graph they describe.
+_graph_stats_cache: "weakref.WeakKeyDictionary[nx.Graph, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
-def load_city_graph(city_name: str) -> nx.MultiDiGraph:
+def load_city_graph(
+    city_name: str,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    force_refresh: bool = False,
+    cache_format: str = "pickle"
+) -> nx.MultiDiGraph:
     """
     Load road network graph for a given city from OpenStreetMap.
 
@@ -34,11 +63,21 @@ def load_city_graph(city_name: str) -> nx.MultiDiGraph:
     graph contains nodes (intersections) and edges (road segments) with
     geographic coordinates and road attributes.
 
+    Built graphs are cached on disk under cache_dir, keyed by the normalized
+    city name, so later loads of the same city skip the Overpass download
+    and graph construction entirely. Pickle caches load fastest but must
+    only be read from a trusted directory; GraphML is a portable text
+    alternative.
+
     Args:
         city_name: Name of the city or place to download.
                    Examples: "Istanbul, Turkey"
                             "Manhattan, New York, USA"
                             "Kadıköy, Istanbul, Turkey"
+        cache_dir: Directory for cached graphs, or None to disable the
+                   on-disk cache (default: ~/.cache/worldcar)
+        force_refresh: If True, download a fresh graph and overwrite the cache
+        cache_format: "pickle" or "graphml" (default: "pickle")
 
     Returns:
         NetworkX MultiDiGraph representing the road network.
@@ -56,6 +95,30 @@ def load_city_graph(city_name: str) -> nx.MultiDiGraph:
         >>> print(f"Loaded {graph.number_of_nodes()} intersections")
         Loaded 12453 intersections
     """
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(
+            f"Unknown cache format '{cache_format}'. "
+            f"Must be one of {', '.join(CACHE_FORMATS)}"
+        )
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _get_cache_path(city_name, cache_dir, cache_format)
+
+        if cache_path.exists() and not force_refresh:
+            try:
+                graph = _read_cached_graph(cache_path, cache_format)
+                logger.info(
+                    f"Loaded cached graph for '{city_name}' from {cache_path}: "
+                    f"{graph.number_of_nodes()} nodes, "
+                    f"{graph.number_of_edges()} edges"
+                )
+                return graph
+            except Exception as e:
+                logger.warning(
+                    f"Ignoring unreadable cached graph at {cache_path}: {str(e)}"
+                )
+
     logger.info(f"Loading road network for: {city_name}")
 
     try:
@@ -73,11 +136,9 @@ def load_city_graph(city_name: str) -> nx.MultiDiGraph:
             f"and {graph.number_of_edges()} edges"
         )
 
-        # Ensure all edges have length in meters
-        # OSMnx typically adds this, but we verify and add if missing
-        graph = _ensure_edge_lengths(graph)
-
-        return graph
+        # Ensure all edges have length in meters and precompute the
+        # per-node-pair minimum lengths used by path length calculation
+        graph = _prepare_graph(graph)
 
     except Exception as e:
         logger.error(f"Failed to load graph for '{city_name}': {str(e)}")
@@ -86,6 +147,70 @@ def load_city_graph(city_name: str) -> nx.MultiDiGraph:
             f"Please check the city name and try again. Error: {str(e)}"
         ) from e
 
+    if cache_path is not None:
+        _write_cached_graph(graph, cache_path, cache_format)
+
+    return graph
+
+
+def load_city_graphs(
+    city_names: List[str],
+    max_workers: int = 8,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    force_refresh: bool = False
+) -> Dict[str, Optional[nx.MultiDiGraph]]:
+    """
+    Load road network graphs for several cities concurrently.
+
+    Each city is loaded with load_city_graph() in a thread pool, so the
+    Overpass round-trips of different cities overlap instead of running
+    back to back. The default of 8 workers keeps the request rate
+    within what the public Overpass servers tolerate.
+
+    Args:
+        city_names: Names of the cities or places to download
+        max_workers: Maximum number of concurrent downloads (default: 8)
+        cache_dir: Directory for cached graphs, or None to disable the
+                   on-disk cache (default: ~/.cache/worldcar)
+        force_refresh: If True, download fresh graphs and overwrite the cache
+
+    Returns:
+        Dictionary mapping each city name to its graph, or None if that city
+        failed to load
+
+    Example:
+        >>> graphs = load_city_graphs(["Kadıköy, Istanbul, Turkey",
+        ...                            "Beşiktaş, Istanbul, Turkey"])
+        >>> print({name: g.number_of_nodes() for name, g in graphs.items() if g})
+    """
+    results: Dict[str, Optional[nx.MultiDiGraph]] = {}
+
+    if not city_names:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                load_city_graph,
+                city_name,
+                cache_dir=cache_dir,
+                force_refresh=force_refresh,
+            ): city_name
+            for city_name in city_names
+        }
+
+        for future, city_name in futures.items():
+            try:
+                results[city_name] = future.result()
+            except Exception as e:
+                logger.error(f"Skipping '{city_name}': {str(e)}")
+                results[city_name] = None
+
+    loaded = sum(1 for graph in results.values() if graph is not None)
+    logger.info(f"Loaded {loaded}/{len(results)} city graphs")
+
+    return results
+
 
 def get_graph_stats(graph: nx.MultiDiGraph) -> Dict[str, Any]:
     """
@@ -94,6 +219,10 @@ def get_graph_stats(graph: nx.MultiDiGraph) -> Dict[str, Any]:
     Computes fundamental graph metrics including node count, edge count,
     and basic network properties.
 
+    Counting edges of a NetworkX multigraph walks every node's adjacency,
+    so results are memoized per graph. Set graph.graph['_stats_dirty'] =
+    True after mutating the graph to force a recount.
+
     Args:
         graph: NetworkX MultiDiGraph representing a road network
 
@@ -118,6 +247,11 @@ def get_graph_stats(graph: nx.MultiDiGraph) -> Dict[str, Any]:
     if not isinstance(graph, (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)):
         raise TypeError(f"Expected NetworkX graph, got {type(graph)}")
 
+    is_dirty = graph.graph.pop('_stats_dirty', False)
+    cached = _graph_stats_cache.get(graph)
+    if cached is not None and not is_dirty:
+        return dict(cached)
+
     stats = {
         'num_nodes': graph.number_of_nodes(),
         'num_edges': graph.number_of_edges(),
@@ -128,7 +262,31 @@ def get_graph_stats(graph: nx.MultiDiGraph) -> Dict[str, Any]:
 
     logger.debug(f"Graph statistics: {stats}")
 
-    return stats
+    _graph_stats_cache[graph] = stats
+
+    return dict(stats)
+
+
+def _prepare_graph(graph: nx.MultiDiGraph) -> nx.MultiDiGraph:
+    """
+    Prepare a freshly downloaded graph for routing.
+
+    Ensures every edge has a 'length' and precomputes the minimum length
+    between each connected node pair (see precompute_min_weight_adj), so the
+    first calculate_path_length() call does not pay for building it.
+
+    Args:
+        graph: NetworkX MultiDiGraph
+
+    Returns:
+        Prepared graph
+
+    Note:
+        This is an internal function called by load_city_graph()
+    """
+    graph = _ensure_edge_lengths(graph)
+    precompute_min_weight_adj(graph, "length", float('inf'))
+    return graph
 
 
 def _ensure_edge_lengths(graph: nx.MultiDiGraph) -> nx.MultiDiGraph:
@@ -138,6 +296,12 @@ def _ensure_edge_lengths(graph: nx.MultiDiGraph) -> nx.MultiDiGraph:
     OSMnx typically adds edge lengths automatically, but this function
     verifies they exist and adds them if missing.
 
+    Graphs built by OSMnx populate 'length' on every edge, so for those a
+    single sampled edge is checked instead of scanning all edges. Other
+    graphs are scanned lazily, stopping at the first edge without a length.
+    Verified graphs are marked with graph.graph['_lengths_verified'] so
+    repeat calls return immediately.
+
     Args:
         graph: NetworkX MultiDiGraph
 
@@ -147,38 +311,144 @@ def _ensure_edge_lengths(graph: nx.MultiDiGraph) -> nx.MultiDiGraph:
     Note:
         This is an internal function called by load_city_graph()
     """
-    # Check if any edges are missing 'length' attribute
-    edges_missing_length = []
+    if graph.graph.get('_lengths_verified'):
+        return graph
 
-    for u, v, key, data in graph.edges(keys=True, data=True):
-        if 'length' not in data:
-            edges_missing_length.append((u, v, key))
+    sample_edge = next(iter(graph.edges(data=True)), None)
+    created_with = str(graph.graph.get('created_with', ''))
+
+    if (
+        sample_edge is not None
+        and 'length' in sample_edge[2]
+        and created_with.startswith('OSMnx')
+    ):
+        logger.debug(
+            f"Graph created with {created_with}; skipping edge length scan"
+        )
+        missing_length = False
+    else:
+        missing_length = any(
+            'length' not in data for _, _, data in graph.edges(data=True)
+        )
 
     # If any edges are missing length, use OSMnx to calculate
-    if edges_missing_length:
+    if missing_length:
         logger.warning(
-            f"Found {len(edges_missing_length)} edges missing 'length' attribute. "
-            f"Adding edge lengths..."
+            "Found edges missing 'length' attribute. Adding edge lengths..."
         )
-        graph = ox.add_edge_lengths(graph)
+        graph = ox.distance.add_edge_lengths(graph)
         logger.info("Edge lengths added successfully")
 
+    graph.graph['_lengths_verified'] = True
+
     return graph
 
 
+def _get_cache_path(city_name: str, cache_dir: str, cache_format: str) -> Path:
+    """
+    Get the on-disk cache file path for a city.
+
+    Args:
+        city_name: Name of the city or place
+        cache_dir: Cache directory (may start with ~)
+        cache_format: "pickle" or "graphml"
+
+    Returns:
+        Path of the cache file
+    """
+    key = hashlib.sha1(city_name.strip().lower().encode("utf-8")).hexdigest()
+    return Path(cache_dir).expanduser() / f"{key}{CACHE_FORMATS[cache_format]}"
+
+
+def _read_cached_graph(cache_path: Path, cache_format: str) -> nx.MultiDiGraph:
+    """
+    Read a graph from the on-disk cache.
+
+    Args:
+        cache_path: Path of the cache file
+        cache_format: "pickle" or "graphml"
+
+    Returns:
+        Cached NetworkX MultiDiGraph
+    """
+    if cache_format == "graphml":
+        return ox.load_graphml(cache_path)
+
+    with open(cache_path, "rb") as f:
+        return pickle.load(f)
+
+
+def _write_cached_graph(
+    graph: nx.MultiDiGraph,
+    cache_path: Path,
+    cache_format: str
+) -> None:
+    """
+    Write a graph to the on-disk cache.
+
+    The file is written to a temporary name and atomically renamed, so
+    concurrent readers never see a partial cache file. Failures are logged
+    and otherwise ignored, since the graph itself was loaded successfully.
+
+    Args:
+        graph: NetworkX MultiDiGraph to cache
+        cache_path: Path of the cache file
+        cache_format: "pickle" or "graphml"
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, suffix=cache_path.suffix
+        )
+        try:
+            if cache_format == "graphml":
+                os.close(fd)
+                # GraphML stores graph attributes as strings, so leave out
+                # the private bookkeeping flags
+                private = {
+                    key: graph.graph.pop(key)
+                    for key in list(graph.graph)
+                    if key.startswith("_")
+                }
+                try:
+                    ox.save_graphml(graph, filepath=tmp_path)
+                finally:
+                    graph.graph.update(private)
+            else:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.info(f"Cached graph at {cache_path}")
+
+    except Exception as e:
+        logger.warning(f"Could not cache graph at {cache_path}: {str(e)}")
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
-def print_graph_info(graph: nx.MultiDiGraph, city_name: str = "Unknown") -> None:
+def print_graph_info(
+    graph: nx.MultiDiGraph,
+    city_name: str = "Unknown",
+    stats: Optional[Dict[str, Any]] = None
+) -> None:
     """
     Print formatted information about a graph.
 
     Convenience function to display graph statistics in a readable format.
+    The report is formatted in full and written with a single print call.
 
     Args:
         graph: NetworkX MultiDiGraph
         city_name: Name of the city (for display purposes)
+        stats: Result of get_graph_stats(graph), if the caller already has
+               it (computed here otherwise)
 
     Example:
         >>> graph = load_city_graph("Kadıköy, Istanbul, Turkey")
@@ -192,16 +462,22 @@ def print_graph_info(graph: nx.MultiDiGraph, city_name: str = "Unknown") -> None
         Directed: Yes
         ========================================
     """
-    stats = get_graph_stats(graph)
+    if stats is None:
+        stats = get_graph_stats(graph)
 
-    print("\n" + "=" * 60)
-    print(f"Road Network: {city_name}".center(60))
-    print("=" * 60)
-    print(f"Nodes (Intersections): {stats['num_nodes']:,}")
-    print(f"Edges (Road Segments): {stats['num_edges']:,}")
-    print(f"Graph Type: {stats['graph_type']}")
-    print(f"Directed: {'Yes' if stats['is_directed'] else 'No'}")
-    print("=" * 60 + "\n")
+    title = f"Road Network: {city_name}".center(60)
+    directed = 'Yes' if stats['is_directed'] else 'No'
+
+    print(f"""
+{_SEP}
+{title}
+{_SEP}
+Nodes (Intersections): {stats['num_nodes']:,}
+Edges (Road Segments): {stats['num_edges']:,}
+Graph Type: {stats['graph_type']}
+Directed: {directed}
+{_SEP}
+""")
 
 
 # ============================================================================
@@ -226,11 +502,9 @@ if __name__ == "__main__":
         # Load the graph
         graph = load_city_graph(test_city)
 
-        # Display statistics
-        print_graph_info(graph, test_city)
-
-        # Get detailed stats
+        # Get statistics and display them
         stats = get_graph_stats(graph)
+        print_graph_info(graph, test_city, stats)
 
         print("Additional Information:")
         print(f"  Graph type: {stats['graph_type']}")
@@ -1,18 +1,31 @@
 """
 Node Mapper for Phase 1 - Coordinate-to-Node Conversion
 
-Simple module to map geographic coordinates to graph nodes using OSMnx.
+Simple module to map geographic coordinates to graph nodes.
+Node coordinates are extracted once per graph into NumPy arrays with a
+KDTree spatial index, so repeated lookups never walk the node dicts again.
 Part of the WorldCar routing system.
 """
 
-from typing import Tuple
+from typing import Any, Dict, Tuple
 import logging
+import weakref
 
-import osmnx as ox
 import networkx as nx
+import numpy as np
+from scipy.spatial import cKDTree
+
+from worldcar.utils import get_coordinate_arrays, node_id_array
 
 logger = logging.getLogger(__name__)
 
+# Per-graph node IDs, radians and spatial index (see _get_coords), derived
+# from the shared utils.get_coordinate_arrays() cache. Entries disappear
+# together with the graph they were built from.
+_graph_coords_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple]" = (
+    weakref.WeakKeyDictionary()
+)
+
 # Coordinate validation constants
 MIN_LATITUDE = -90.0
 MAX_LATITUDE = 90.0
@@ -29,8 +42,8 @@ def find_nearest_node(
     """
     Find the nearest graph node to given coordinates.
 
-    Uses OSMnx's nearest_nodes function to find the closest intersection
-    in the road network to the specified latitude and longitude.
+    Uses a cached KDTree over the graph's node coordinates (see _get_coords)
+    to find the closest intersection by great-circle distance.
 
     Args:
         graph: NetworkX MultiDiGraph road network
@@ -60,7 +73,10 @@ def find_nearest_node(
         validate_coordinates(latitude, longitude)
 
     try:
-        nearest_node = ox.nearest_nodes(graph, X=longitude, Y=latitude)
+        ids, _, _, _, tree, _, _ = _get_coords(graph)
+        query = _unit_vectors(np.radians([latitude]), np.radians([longitude]))
+        _, idx = tree.query(query, k=1)
+        nearest_node = ids[idx[:1]].tolist()[0]
         logger.debug(f"Found node {nearest_node} for ({latitude:.6f}, {longitude:.6f})")
         return nearest_node
 
@@ -108,6 +124,47 @@ def get_node_coordinates(graph: nx.MultiDiGraph, node_id: int) -> Tuple[float, f
     return node_data['y'], node_data['x']
 
 
+def get_nodes_coordinates(graph: nx.MultiDiGraph, node_ids: list[int]) -> np.ndarray:
+    """
+    Get latitude and longitude coordinates for many graph nodes at once.
+
+    Reads the cached coordinate arrays (see _get_coords) with one fancy
+    index instead of looking up each node's attribute dict, which pays off
+    when pre- or post-processing many route endpoints. For a single node,
+    get_node_coordinates() is faster.
+
+    Args:
+        graph: NetworkX MultiDiGraph road network
+        node_ids: Node IDs to look up
+
+    Returns:
+        Array of shape (n, 2) with (latitude, longitude) rows in decimal degrees
+
+    Raises:
+        KeyError: If a node ID does not exist in graph
+        ValueError: If any graph node is missing coordinate attributes
+
+    Example:
+        >>> coords = get_nodes_coordinates(graph, result['node_ids'])
+        >>> print(f"Route starts at {coords[0]}")
+    """
+    _, index, _, _, _, lats, lons = _get_coords(graph)
+
+    try:
+        positions = np.fromiter(
+            (index[node_id] for node_id in node_ids),
+            dtype=np.intp,
+            count=len(node_ids),
+        )
+    except KeyError as e:
+        raise KeyError(
+            f"Node {e.args[0]} not found in graph. "
+            f"Graph has {graph.number_of_nodes()} nodes."
+        ) from None
+
+    return np.column_stack((lats[positions], lons[positions]))
+
+
 def validate_coordinates(latitude: float, longitude: float) -> None:
     """
     Validate that coordinates are within valid ranges.
@@ -157,6 +214,71 @@ def validate_coordinates(latitude: float, longitude: float) -> None:
         )
 
 
+def validate_coordinates_batch(coordinates: list[Tuple[float, float]]) -> np.ndarray:
+    """
+    Validate many coordinate pairs at once.
+
+    The whole batch is checked with a few vectorized NumPy comparisons.
+    Only when a pair fails is the scalar validate_coordinates run on it,
+    to produce the same error message a single lookup would.
+
+    Args:
+        coordinates: List of (latitude, longitude) tuples
+
+    Returns:
+        Array of shape (n, 2) with the coordinates as float64
+
+    Raises:
+        ValueError: If any coordinates are invalid, naming the first bad index
+
+    Example:
+        >>> coords = validate_coordinates_batch([(40.9856, 29.0298)])
+        >>> coords.shape
+        (1, 2)
+    """
+    if len(coordinates) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+
+    try:
+        arr = np.asarray(coordinates)
+    except ValueError:
+        arr = None  # Ragged input
+
+    if (
+        arr is None
+        or arr.ndim != 2
+        or arr.shape[1] != 2
+        or arr.dtype.kind not in 'biuf'
+    ):
+        # Non-numeric or malformed input: locate it pair by pair
+        for i, coord in enumerate(coordinates):
+            try:
+                lat, lon = coord
+                validate_coordinates(lat, lon)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid coordinates at index {i}: {str(e)}") from e
+        raise ValueError("Coordinates must be (latitude, longitude) pairs")
+
+    arr = arr.astype(np.float64, copy=False)
+    lats = arr[:, 0]
+    lons = arr[:, 1]
+
+    # NaN fails every comparison, so it is caught by the range checks too
+    valid = (
+        (lats >= MIN_LATITUDE) & (lats <= MAX_LATITUDE)
+        & (lons >= MIN_LONGITUDE) & (lons <= MAX_LONGITUDE)
+    )
+    if not valid.all():
+        i = int(np.argmin(valid))
+        lat, lon = coordinates[i]
+        try:
+            validate_coordinates(lat, lon)
+        except ValueError as e:
+            raise ValueError(f"Invalid coordinates at index {i}: {str(e)}") from e
+
+    return arr
+
+
 def batch_find_nearest_nodes(
     graph: nx.MultiDiGraph,
     coordinates: list[Tuple[float, float]],
@@ -186,22 +308,17 @@ def batch_find_nearest_nodes(
         return []
 
     if validate:
-        for i, (lat, lon) in enumerate(coordinates):
-            try:
-                validate_coordinates(lat, lon)
-            except ValueError as e:
-                raise ValueError(f"Invalid coordinates at index {i}: {str(e)}") from e
+        coords = validate_coordinates_batch(coordinates)
+    else:
+        coords = np.asarray(coordinates, dtype=np.float64)
 
-    latitudes = [coord[0] for coord in coordinates]
-    longitudes = [coord[1] for coord in coordinates]
+    latitudes = np.radians(coords[:, 0])
+    longitudes = np.radians(coords[:, 1])
 
     try:
-        nearest_nodes = ox.nearest_nodes(graph, X=longitudes, Y=latitudes)
-
-        if isinstance(nearest_nodes, (int, float)):
-            nearest_nodes = [int(nearest_nodes)]
-        else:
-            nearest_nodes = list(nearest_nodes)
+        ids, _, _, _, tree, _, _ = _get_coords(graph)
+        _, idx = tree.query(_unit_vectors(latitudes, longitudes), k=1)
+        nearest_nodes = ids[idx].tolist()
 
         logger.info(f"Found nearest nodes for {len(coordinates)} coordinates")
         return nearest_nodes
@@ -213,3 +330,64 @@ def batch_find_nearest_nodes(
         )
         logger.error(error_msg)
         raise RuntimeError(error_msg) from e
+
+
+def _get_coords(
+    graph: nx.MultiDiGraph
+) -> Tuple[
+    np.ndarray, Dict[Any, int], np.ndarray, np.ndarray, cKDTree, np.ndarray, np.ndarray
+]:
+    """
+    Get cached node coordinate arrays and spatial index for a graph.
+
+    Latitude and longitude in degrees and the node index come from
+    utils.get_coordinate_arrays(), which bounding box and extent queries
+    share. On top of them this adds node IDs, latitude and longitude in
+    radians, and a KDTree over the nodes' unit-sphere vectors. Euclidean
+    (chord) distance between unit vectors increases monotonically with
+    great-circle distance, so the KDTree's nearest neighbor is the nearest
+    node by Haversine distance. Rebuilt whenever the shared coordinate
+    arrays are (e.g. when the node count changes).
+
+    Args:
+        graph: NetworkX graph with node attributes 'x' (lon) and 'y' (lat)
+
+    Returns:
+        Tuple of (ids, index, lat_rad, lon_rad, tree, lats, lons)
+
+    Raises:
+        ValueError: If a node is missing coordinate attributes
+    """
+    lats, lons, index = get_coordinate_arrays(graph)
+
+    cached = _graph_coords_cache.get(graph)
+    if cached is not None and cached[5] is lats:
+        return cached
+
+    ids = node_id_array(list(index))
+    lat_rad = np.radians(lats)
+    lon_rad = np.radians(lons)
+    tree = cKDTree(_unit_vectors(lat_rad, lon_rad))
+
+    logger.debug(f"Built coordinate index for {len(ids)} nodes")
+
+    cached = (ids, index, lat_rad, lon_rad, tree, lats, lons)
+    _graph_coords_cache[graph] = cached
+    return cached
+
+
+def _unit_vectors(lat_rad: np.ndarray, lon_rad: np.ndarray) -> np.ndarray:
+    """
+    Convert latitudes/longitudes in radians to 3D unit-sphere vectors.
+
+    Args:
+        lat_rad: Latitudes in radians
+        lon_rad: Longitudes in radians
+
+    Returns:
+        Array of shape (n, 3)
+    """
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))
+    )
@@ -1,32 +1,141 @@
 """
 Path Service for Phase 1 - Shortest Path Computation
 
-Computes shortest paths using Dijkstra's algorithm via NetworkX.
+Computes shortest paths using Dijkstra's algorithm. The graph is converted
+once to a SciPy CSR matrix so the search runs in compiled code; NetworkX is
+used as a fallback when SciPy is unavailable.
 Part of the WorldCar routing system.
 """
 
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
+import threading
+import warnings
+import weakref
 
 import networkx as nx
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import (
+        breadth_first_order,
+        connected_components,
+        dijkstra,
+        reverse_cuthill_mckee,
+    )
+except ImportError:  # pragma: no cover
+    csr_matrix = None
+    breadth_first_order = None
+    connected_components = None
+    dijkstra = None
+    reverse_cuthill_mckee = None
+
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from worldcar.utils import (
+    clear_min_weight_adj_cache,
+    get_coordinate_arrays,
+    graph_version,
+    haversine_distance,
+    iter_min_weight_edges,
+    node_id_array,
+    precompute_min_weight_adj,
+)
 
 logger = logging.getLogger(__name__)
 
+# Supported shortest path methods
+SHORTEST_PATH_METHODS = ("dijkstra", "astar", "bidirectional", "igraph")
+
+# Memory budget in bytes for the (sources x nodes) distance and predecessor
+# arrays of one SciPy dijkstra call in compute_shortest_paths_many. Each
+# source row costs about 16 bytes per node, so the number of sources per
+# call shrinks as graphs grow.
+MANY_SOURCES_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Maximum number of computed paths remembered per graph (see
+# compute_shortest_path)
+PATH_CACHE_SIZE = 4096
+
+# CSR edge weight dtype. SciPy's csgraph routines cast their input to
+# float64 on every call, so float32 weights would cost a full copy of the
+# weight array per query instead of saving bandwidth.
+CSR_WEIGHT_DTYPE = np.float64
+
+# The per-graph caches below map a graph to (graph_version, entry), so an
+# entry is rebuilt once nodes are added or removed. Edge-only edits need an
+# explicit clear_path_cache(). Entries disappear together with the graph
+# they were built from.
+
+# Per-graph CSR adjacency, keyed by weight attribute
+_csr_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, Dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Per-graph LRU of computed paths, keyed by (start, end, weight, method)
+_path_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, OrderedDict]]" = (
+    weakref.WeakKeyDictionary()
+)
+_path_cache_lock = threading.Lock()
+
+# Per-graph strongly connected components and condensation reachability
+# (see _get_reachability)
+_reach_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, Dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Per-graph igraph copies (see _to_igraph), keyed by weight attribute
+_igraph_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, Dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def compute_shortest_path(
     graph: nx.MultiDiGraph,
     start_node: int,
     end_node: int,
-    weight: str = "length"
+    weight: str = "length",
+    method: str = "dijkstra"
 ) -> Dict[str, Any]:
     """
-    Compute shortest path between two nodes using Dijkstra's algorithm.
+    Compute shortest path between two nodes.
+
+    With method="dijkstra" the search runs on a cached CSR representation
+    of the graph with scipy.sparse.csgraph.dijkstra. The CSR matrix is built
+    on first use and reused for later queries on the same graph until nodes
+    are added or removed (see graph_version); call clear_path_cache() after
+    adding, removing or reweighting edges.
+
+    method="astar" runs NetworkX A* guided by the great-circle distance to
+    the target, which expands far fewer nodes on long routes. The heuristic
+    is only admissible for distance weights, so for any weight other than
+    "length" A* degrades to plain Dijkstra. method="bidirectional" runs
+    NetworkX bidirectional Dijkstra. method="igraph" routes on a cached
+    python-igraph copy of the graph (optional dependency), keeping the
+    NetworkX graph as the source of truth.
+
+    Successful results are kept in a per-graph LRU cache of PATH_CACHE_SIZE
+    entries, so repeated origin-destination queries skip the search. Cached
+    results are dropped when nodes or edges are added or removed; call
+    clear_path_cache() after editing edge weights in place.
 
     Args:
         graph: NetworkX MultiDiGraph road network
         start_node: Starting node ID
         end_node: Ending node ID
         weight: Edge attribute to use as weight (default: "length")
+        method: "dijkstra", "astar", "bidirectional" or "igraph"
+                (default: "dijkstra")
 
     Returns:
         Dictionary containing:
@@ -55,6 +164,17 @@ def compute_shortest_path(
     if end_node not in graph:
         raise ValueError(f"End node {end_node} not found in graph")
 
+    if method not in SHORTEST_PATH_METHODS:
+        raise ValueError(
+            f"Unknown method '{method}'. "
+            f"Must be one of {', '.join(SHORTEST_PATH_METHODS)}"
+        )
+
+    if method == "igraph" and igraph is None:
+        raise ValueError(
+            "method='igraph' requires python-igraph (pip install igraph)"
+        )
+
     if start_node == end_node:
         return {
             'success': True,
@@ -66,20 +186,57 @@ def compute_shortest_path(
             'message': 'Start and end nodes are identical'
         }
 
+    cache_key = (start_node, end_node, weight, method)
+    cached = _get_cached_path(graph, cache_key)
+    if cached is not None:
+        logger.debug(f"Path cache hit for {start_node} -> {end_node}")
+        return cached
+
     try:
-        path = nx.shortest_path(
-            graph,
-            source=start_node,
-            target=end_node,
-            weight=weight,
-            method='dijkstra'
-        )
+        # Unreachable targets are answered from the cached component
+        # structure without running a search
+        if connected_components is not None and not has_path(
+            graph, start_node, end_node
+        ):
+            raise nx.NetworkXNoPath(f"No path between {start_node} and {end_node}")
+
+        if method == "astar":
+            heuristic = (
+                _make_haversine_heuristic(graph, end_node)
+                if weight == "length" else None
+            )
+            path = nx.astar_path(
+                graph,
+                start_node,
+                end_node,
+                heuristic=heuristic,
+                weight=weight
+            )
+        elif method == "bidirectional":
+            _, path = nx.bidirectional_dijkstra(
+                graph,
+                start_node,
+                end_node,
+                weight=weight
+            )
+        elif method == "igraph":
+            path = _igraph_shortest_path(graph, start_node, end_node, weight)
+        elif dijkstra is None:
+            path = nx.shortest_path(
+                graph,
+                source=start_node,
+                target=end_node,
+                weight=weight,
+                method='dijkstra'
+            )
+        else:
+            path = _csr_shortest_path(graph, start_node, end_node, weight)
 
         path_length = calculate_path_length(graph, path, weight)
 
         logger.info(f"Found path: {len(path)} nodes, {path_length:.2f}m")
 
-        return {
+        result = {
             'success': True,
             'node_ids': path,
             'path_length_m': path_length,
@@ -88,6 +245,9 @@ def compute_shortest_path(
             'end_node': end_node,
             'message': f'Path found: {len(path)} nodes, {path_length:.2f} meters'
         }
+        _store_cached_path(graph, cache_key, result)
+
+        return {**result, 'node_ids': list(path)}
 
     except nx.NetworkXNoPath:
         logger.warning(f"No path from {start_node} to {end_node}")
@@ -117,6 +277,503 @@ def compute_shortest_path(
         }
 
 
+def clear_path_cache(graph: Optional[nx.MultiDiGraph] = None) -> None:
+    """
+    Forget cached paths and the routing structures derived from a graph.
+
+    Drops cached compute_shortest_path() results together with the CSR,
+    reachability, igraph and min-weight adjacency tables built from the
+    graph.
+    Adding or removing nodes already invalidates these; call this after
+    adding, removing or reweighting edges between existing nodes.
+
+    Args:
+        graph: Graph whose caches to drop, or None to clear all graphs
+
+    Example:
+        >>> graph.remove_edge(u, v)
+        >>> clear_path_cache(graph)
+    """
+    with _path_cache_lock:
+        if graph is None:
+            _path_cache.clear()
+        else:
+            _path_cache.pop(graph, None)
+
+    if graph is None:
+        _csr_cache.clear()
+        _reach_cache.clear()
+        _igraph_cache.clear()
+    else:
+        _csr_cache.pop(graph, None)
+        _reach_cache.pop(graph, None)
+        _igraph_cache.pop(graph, None)
+    clear_min_weight_adj_cache(graph)
+
+
+def _versioned_entry(
+    cache: weakref.WeakKeyDictionary,
+    graph: nx.MultiDiGraph,
+    factory: Callable[[], Any] = dict,
+    version: Optional[int] = None
+) -> Any:
+    """
+    Get a graph's entry in a version-stamped cache, resetting it if stale.
+
+    Args:
+        cache: Cache mapping graphs to (graph_version, entry)
+        graph: NetworkX graph road network
+        factory: Creates an empty entry
+        version: The graph's current graph_version, if already known
+
+    Returns:
+        The entry for the graph's current version
+    """
+    if version is None:
+        version = graph_version(graph)
+    stamped = cache.get(graph)
+    if stamped is None or stamped[0] != version:
+        stamped = (version, factory())
+        cache[graph] = stamped
+    return stamped[1]
+
+
+def _get_cached_path(
+    graph: nx.MultiDiGraph,
+    key: Tuple[Any, Any, str, str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached path result, marking it as recently used.
+
+    Args:
+        graph: NetworkX graph road network
+        key: (start_node, end_node, weight, method)
+
+    Returns:
+        Copy of the cached result dictionary, or None on a miss
+    """
+    version = graph_version(graph)
+    with _path_cache_lock:
+        per_graph = _versioned_entry(_path_cache, graph, OrderedDict, version)
+        if key not in per_graph:
+            return None
+        per_graph.move_to_end(key)
+        result = per_graph[key]
+
+    return {**result, 'node_ids': list(result['node_ids'])}
+
+
+def _store_cached_path(
+    graph: nx.MultiDiGraph,
+    key: Tuple[Any, Any, str, str],
+    result: Dict[str, Any]
+) -> None:
+    """
+    Add a path result to the graph's LRU cache, evicting the oldest entry.
+
+    Args:
+        graph: NetworkX graph road network
+        key: (start_node, end_node, weight, method)
+        result: Result dictionary returned by compute_shortest_path()
+    """
+    version = graph_version(graph)
+    with _path_cache_lock:
+        per_graph = _versioned_entry(_path_cache, graph, OrderedDict, version)
+        per_graph[key] = result
+        per_graph.move_to_end(key)
+        if len(per_graph) > PATH_CACHE_SIZE:
+            per_graph.popitem(last=False)
+
+
+def compute_shortest_paths_many(
+    graph: nx.MultiDiGraph,
+    starts: List[int],
+    ends: List[int],
+    weight: str = "length"
+) -> List[Dict[str, Any]]:
+    """
+    Compute shortest paths for many (start, end) pairs at once.
+
+    Pairs are grouped by start node and each distinct start is solved once
+    with SciPy's compiled Dijkstra, which answers every destination sharing
+    that start. This is much cheaper than calling compute_shortest_path()
+    per pair for fleet-dispatch or origin-destination matrix workloads.
+
+    Args:
+        graph: NetworkX MultiDiGraph road network
+        starts: Starting node IDs
+        ends: Ending node IDs, paired element-wise with starts
+        weight: Edge attribute to use as weight (default: "length")
+
+    Returns:
+        List of result dictionaries, one per (start, end) pair, in the same
+        format as compute_shortest_path()
+
+    Raises:
+        ValueError: If starts and ends differ in length or contain unknown nodes
+
+    Example:
+        >>> results = compute_shortest_paths_many(graph, [a, a, b], [c, d, c])
+        >>> print([r['path_length_m'] for r in results])
+    """
+    if len(starts) != len(ends):
+        raise ValueError(
+            f"starts and ends must have the same length, "
+            f"got {len(starts)} and {len(ends)}"
+        )
+
+    for node in (*starts, *ends):
+        if node not in graph:
+            raise ValueError(f"Node {node} not found in graph")
+
+    if dijkstra is None:
+        return [
+            compute_shortest_path(graph, start, end, weight)
+            for start, end in zip(starts, ends)
+        ]
+
+    node_id_to_idx, idx_to_node_id, csr = _build_csr(graph, weight)
+
+    # Group destinations by start so each start is solved once
+    ends_by_start: Dict[int, Dict[int, None]] = {}
+    for start, end in zip(starts, ends):
+        if start != end:
+            ends_by_start.setdefault(start, {})[end] = None
+
+    unique_starts = list(ends_by_start)
+    paths: Dict[Tuple[int, int], List[int]] = {}
+
+    chunk_size = max(1, MANY_SOURCES_MEMORY_BUDGET // (16 * csr.shape[0]))
+    for chunk_start in range(0, len(unique_starts), chunk_size):
+        chunk = unique_starts[chunk_start:chunk_start + chunk_size]
+        distances, predecessors = dijkstra(
+            csr,
+            directed=graph.is_directed(),
+            indices=[node_id_to_idx[start] for start in chunk],
+            return_predecessors=True,
+        )
+
+        for row, start in enumerate(chunk):
+            start_idx = node_id_to_idx[start]
+            for end in ends_by_start[start]:
+                end_idx = node_id_to_idx[end]
+                if np.isinf(distances[row, end_idx]):
+                    paths[(start, end)] = []
+                else:
+                    paths[(start, end)] = idx_to_node_id[
+                        _reconstruct_path(predecessors[row], start_idx, end_idx)
+                    ].tolist()
+
+    results = []
+    for start, end in zip(starts, ends):
+        path = [start] if start == end else paths[(start, end)]
+        path_length = calculate_path_length(graph, path, weight)
+
+        results.append({
+            'success': bool(path),
+            'node_ids': list(path),
+            'path_length_m': path_length,
+            'num_nodes': len(path),
+            'start_node': start,
+            'end_node': end,
+            'message': (
+                f'Path found: {len(path)} nodes, {path_length:.2f} meters'
+                if path else
+                f'No path exists between nodes {start} and {end}'
+            )
+        })
+
+    logger.info(
+        f"Computed {len(results)} paths from {len(unique_starts)} distinct starts"
+    )
+
+    return results
+
+
+def _build_csr(
+    graph: nx.MultiDiGraph,
+    weight: str = "length"
+) -> Tuple[Dict[Any, int], np.ndarray, "csr_matrix"]:
+    """
+    Build (or fetch from cache) a CSR adjacency matrix for a graph.
+
+    Parallel edges are collapsed to their minimum weight. Edges missing the
+    weight attribute get weight 1, matching NetworkX's Dijkstra. Nodes are
+    numbered in reverse Cuthill-McKee order for cache locality. Weights are
+    stored as CSR_WEIGHT_DTYPE and indptr/indices as int32, which is what
+    SciPy's dijkstra uses internally, so queries run on the cached arrays
+    as-is. Routing works on these int32 indices throughout; node IDs (64-bit
+    OSM IDs) live in a separate array and are only mapped back for results.
+
+    Args:
+        graph: NetworkX graph road network
+        weight: Edge attribute to use as weight
+
+    Returns:
+        Tuple of (node_id_to_idx, idx_to_node_id, csr), where idx_to_node_id
+        is an array of node IDs (int64 for integer IDs)
+
+    Raises:
+        ValueError: If the graph has too many nodes or edges for int32 indices
+
+    Note:
+        This is an internal function called by compute_shortest_path()
+    """
+    per_graph = _versioned_entry(_csr_cache, graph)
+    if weight in per_graph:
+        return per_graph[weight]
+
+    node_list = list(graph.nodes)
+    node_id_to_idx = {node_id: i for i, node_id in enumerate(node_list)}
+
+    # Edges come out of iter_min_weight_edges grouped by source node, in
+    # node order, which is CSR row order: row pointers are the neighbor
+    # counts and (column, weight) pairs stream straight into one array.
+    n = len(node_list)
+
+    # Row pointers are summed in int64 so the size check sees the true
+    # total before anything is narrowed to int32
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter(
+            (len(nbrs) for nbrs in graph._adj.values()), dtype=np.int64, count=n
+        ),
+        out=indptr[1:],
+    )
+    nnz = int(indptr[-1])
+
+    if n > np.iinfo(np.int32).max or nnz > np.iinfo(np.int32).max:
+        raise ValueError(
+            f"Graph too large for int32 CSR indices: {n} nodes, {nnz} edges"
+        )
+    indptr = indptr.astype(np.int32)
+
+    edges = np.fromiter(
+        (
+            (node_id_to_idx[v], w)
+            for _, v, w in iter_min_weight_edges(graph, weight, default=1)
+        ),
+        dtype=[('col', np.int32), ('weight', CSR_WEIGHT_DTYPE)],
+        count=nnz,
+    )
+    indices = np.ascontiguousarray(edges['col'])
+    weights = np.ascontiguousarray(edges['weight'])
+
+    csr = csr_matrix((weights, indices, indptr), shape=(n, n))
+
+    # Renumber nodes in reverse Cuthill-McKee order so neighboring nodes get
+    # nearby indices, keeping Dijkstra's distance array accesses local. The
+    # node ID maps absorb the permutation, so callers are unaffected.
+    idx_to_node_id = node_id_array(node_list)
+    if n > 0:
+        perm = reverse_cuthill_mckee(csr, symmetric_mode=False)
+        csr = csr[perm][:, perm]
+        csr.sort_indices()
+        idx_to_node_id = idx_to_node_id[perm]
+        node_id_to_idx = {
+            node_id: i for i, node_id in enumerate(idx_to_node_id.tolist())
+        }
+
+    logger.debug(f"Built CSR adjacency: {n} nodes, {csr.nnz} edges")
+
+    per_graph[weight] = (node_id_to_idx, idx_to_node_id, csr)
+    return per_graph[weight]
+
+
+def _reconstruct_path(
+    predecessors: np.ndarray,
+    start_idx: int,
+    end_idx: int
+) -> np.ndarray:
+    """
+    Walk a Dijkstra predecessor array back from end to start.
+
+    Written as plain loops over arrays so Numba can compile it (see below);
+    the first pass counts hops, the second fills a preallocated buffer from
+    the back, so no list is grown or reversed.
+
+    Args:
+        predecessors: Predecessor array returned by scipy's dijkstra
+        start_idx: CSR index of the start node
+        end_idx: CSR index of the end node
+
+    Returns:
+        int32 array of CSR indices from start to end
+    """
+    num_nodes = 1
+    current = end_idx
+    while current != start_idx:
+        current = predecessors[current]
+        num_nodes += 1
+
+    path = np.empty(num_nodes, dtype=np.int32)
+    current = end_idx
+    for i in range(num_nodes - 1, -1, -1):
+        path[i] = current
+        if i > 0:
+            current = predecessors[current]
+
+    return path
+
+
+# Compile the predecessor walk when Numba is installed (optional dependency)
+if njit is not None:
+    _reconstruct_path = njit(cache=True)(_reconstruct_path)
+
+
+def _csr_shortest_path(
+    graph: nx.MultiDiGraph,
+    start_node: int,
+    end_node: int,
+    weight: str = "length"
+) -> List[int]:
+    """
+    Compute a shortest path with SciPy's compiled Dijkstra.
+
+    Args:
+        graph: NetworkX MultiDiGraph road network
+        start_node: Starting node ID
+        end_node: Ending node ID
+        weight: Edge attribute to use as weight
+
+    Returns:
+        List of node IDs in path
+
+    Raises:
+        nx.NetworkXNoPath: If end_node is unreachable from start_node
+    """
+    node_id_to_idx, idx_to_node_id, csr = _build_csr(graph, weight)
+    start_idx = node_id_to_idx[start_node]
+    end_idx = node_id_to_idx[end_node]
+
+    distances, predecessors = dijkstra(
+        csr,
+        directed=graph.is_directed(),
+        indices=start_idx,
+        return_predecessors=True,
+    )
+
+    if np.isinf(distances[end_idx]):
+        raise nx.NetworkXNoPath(f"No path between {start_node} and {end_node}")
+
+    return idx_to_node_id[
+        _reconstruct_path(predecessors, start_idx, end_idx)
+    ].tolist()
+
+
+def _to_igraph(graph: nx.MultiDiGraph, weight: str = "length") -> Tuple[Any, Any]:
+    """
+    Build (or fetch from cache) an igraph copy of a graph.
+
+    The copy reuses the CSR adjacency from _build_csr, so parallel edges are
+    already collapsed to their minimum weight and vertex i is node
+    idx_to_node_id[i]. Like the CSR cache, it is rebuilt when nodes or edges
+    are added or removed.
+
+    Args:
+        graph: NetworkX graph road network
+        weight: Edge attribute to use as weight
+
+    Returns:
+        Tuple of ((node_id_to_idx, idx_to_node_id, csr), igraph.Graph)
+    """
+    per_graph = _versioned_entry(_igraph_cache, graph)
+    if weight in per_graph:
+        return per_graph[weight]
+
+    csr_data = _build_csr(graph, weight)
+    coo = csr_data[2].tocoo()
+
+    ig_graph = igraph.Graph(
+        n=coo.shape[0],
+        edges=np.column_stack((coo.row, coo.col)).tolist(),
+        directed=graph.is_directed(),
+        edge_attrs={'weight': coo.data.tolist()},
+    )
+
+    logger.debug(
+        f"Built igraph copy: {ig_graph.vcount()} nodes, {ig_graph.ecount()} edges"
+    )
+
+    per_graph[weight] = (csr_data, ig_graph)
+    return per_graph[weight]
+
+
+def _igraph_shortest_path(
+    graph: nx.MultiDiGraph,
+    start_node: int,
+    end_node: int,
+    weight: str = "length"
+) -> List[int]:
+    """
+    Compute a shortest path with igraph's compiled Dijkstra.
+
+    Args:
+        graph: NetworkX MultiDiGraph road network
+        start_node: Starting node ID
+        end_node: Ending node ID
+        weight: Edge attribute to use as weight
+
+    Returns:
+        List of node IDs in path
+
+    Raises:
+        nx.NetworkXNoPath: If end_node is unreachable from start_node
+    """
+    (node_id_to_idx, idx_to_node_id, _), ig_graph = _to_igraph(graph, weight)
+
+    # igraph warns (instead of raising) when the target is unreachable
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        vertices = ig_graph.get_shortest_paths(
+            node_id_to_idx[start_node],
+            to=node_id_to_idx[end_node],
+            weights='weight',
+            mode='out',
+            output='vpath',
+        )[0]
+
+    if not vertices:
+        raise nx.NetworkXNoPath(f"No path between {start_node} and {end_node}")
+
+    return idx_to_node_id[vertices].tolist()
+
+
+def _make_haversine_heuristic(
+    graph: nx.MultiDiGraph,
+    target: int
+) -> Callable[[int, int], float]:
+    """
+    Build an A* heuristic returning the great-circle distance to a target.
+
+    Each call computes one scalar Haversine distance from the cached
+    coordinate arrays (see utils.get_coordinate_arrays), so a query only
+    pays for the nodes A* actually discovers. NetworkX stores the value per
+    queued node, so nodes are not re-evaluated.
+
+    Args:
+        graph: NetworkX graph with node attributes 'x' (lon) and 'y' (lat)
+        target: Target node ID
+
+    Returns:
+        Function heuristic(u, v) returning the distance from u to target in
+        meters
+
+    Note:
+        This is an internal function called by compute_shortest_path()
+    """
+    lats, lons, index = get_coordinate_arrays(graph)
+    target_idx = index[target]
+    target_lat = lats.item(target_idx)
+    target_lon = lons.item(target_idx)
+
+    def heuristic(u: int, v: int) -> float:
+        i = index[u]
+        return haversine_distance(lats.item(i), lons.item(i), target_lat, target_lon)
+
+    return heuristic
+
+
 def calculate_path_length(
     graph: nx.MultiDiGraph,
     path: List[int],
@@ -125,6 +782,11 @@ def calculate_path_length(
     """
     Calculate total length of a path by summing edge weights.
 
+    Uses the graph's precomputed minimum-weight adjacency (see
+    precompute_min_weight_adj), so each hop is a single dict lookup. As
+    before, a multigraph hop whose edges all lack the weight counts as
+    infinity and a simple-graph edge without it as 0.0.
+
     Args:
         graph: NetworkX MultiDiGraph road network
         path: List of node IDs forming the path
@@ -139,30 +801,23 @@ def calculate_path_length(
     if len(path) < 2:
         return 0.0
 
-    total_length = 0.0
+    default = float('inf') if graph.is_multigraph() else 0.0
+    adj = precompute_min_weight_adj(graph, weight, default)
 
-    for i in range(len(path) - 1):
-        start = path[i]
-        end = path[i + 1]
-
-        if graph.is_multigraph():
-            edge_data = graph[start][end]
-            min_weight = min(
-                data.get(weight, float('inf'))
-                for data in edge_data.values()
-            )
-            total_length += min_weight
-        else:
-            edge_data = graph[start][end]
-            total_length += edge_data.get(weight, 0.0)
-
-    return total_length
+    return sum((adj[u][v] for u, v in zip(path, path[1:])), 0.0)
 
 
 def has_path(graph: nx.MultiDiGraph, start_node: int, end_node: int) -> bool:
     """
     Check if a path exists between two nodes.
 
+    Answered from the graph's strongly connected components, computed once
+    per graph (see _get_reachability): nodes in the same component always
+    reach each other, and otherwise the components' reachability in the
+    condensation DAG decides. On road networks most nodes share one giant
+    component, so a typical query is a single array comparison. Falls back
+    to a NetworkX search when SciPy is unavailable.
+
     Args:
         graph: NetworkX MultiDiGraph road network
         start_node: Starting node ID
@@ -171,7 +826,82 @@ def has_path(graph: nx.MultiDiGraph, start_node: int, end_node: int) -> bool:
     Returns:
         True if a path exists, False otherwise
     """
-    try:
-        return nx.has_path(graph, start_node, end_node)
-    except (nx.NodeNotFound, nx.NetworkXError):
+    if connected_components is None:
+        try:
+            return nx.has_path(graph, start_node, end_node)
+        except (nx.NodeNotFound, nx.NetworkXError):
+            return False
+
+    if start_node not in graph or end_node not in graph:
         return False
+
+    node_id_to_idx, labels, condensation, reachable = _get_reachability(graph)
+    source = labels[node_id_to_idx[start_node]]
+    target = labels[node_id_to_idx[end_node]]
+
+    if source == target:
+        return True
+
+    if condensation is None:
+        return False
+
+    if source not in reachable:
+        order = breadth_first_order(
+            condensation, source, directed=True, return_predecessors=False
+        )
+        mask = np.zeros(condensation.shape[0], dtype=bool)
+        mask[order] = True
+        reachable[source] = mask
+
+    return bool(reachable[source][target])
+
+
+def _get_reachability(
+    graph: nx.MultiDiGraph
+) -> Tuple[Dict[Any, int], np.ndarray, Optional["csr_matrix"], Dict[int, np.ndarray]]:
+    """
+    Get (or build and cache) the component structure used by has_path().
+
+    Strongly connected components are labelled on the cached CSR adjacency
+    (weakly connected for undirected graphs, where the condensation is not
+    needed). The condensation DAG has one vertex per component and an edge
+    wherever an edge of the graph crosses components. Which components are
+    reachable from a given one is filled in lazily, one breadth-first search
+    per source component. Rebuilt when nodes or edges are added or removed.
+
+    Args:
+        graph: NetworkX graph road network
+
+    Returns:
+        Tuple of (node_id_to_idx, labels, condensation, reachable), where
+        labels[i] is the component of node index i, condensation is None for
+        undirected graphs and reachable maps a component to a boolean mask
+        over components
+    """
+    per_graph = _versioned_entry(_reach_cache, graph)
+    if 'reach' in per_graph:
+        return per_graph['reach']
+
+    node_id_to_idx, _, csr = _build_csr(graph)
+    directed = graph.is_directed()
+    num_components, labels = connected_components(
+        csr, directed=directed, connection='strong'
+    )
+
+    condensation = None
+    if directed:
+        rows = np.repeat(labels, np.diff(csr.indptr))
+        cols = labels[csr.indices]
+        crossing = rows != cols
+        condensation = csr_matrix(
+            (
+                np.ones(int(crossing.sum()), dtype=np.int32),
+                (rows[crossing], cols[crossing]),
+            ),
+            shape=(num_components, num_components),
+        )
+
+    logger.debug(f"Labelled {num_components} connected components")
+
+    per_graph['reach'] = (node_id_to_idx, labels, condensation, {})
+    return per_graph['reach']
@@ -6,30 +6,224 @@ for road network graphs, including node/edge counts, connectivity analysis,
 and geographic extent calculations.
 """
 
+import dataclasses
 import logging
-from typing import Dict, Any
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 
-from worldcar.utils import get_bounding_box, format_distance, meters_to_km
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+from worldcar.config import STATS_PARALLEL_BACKEND, STATS_PARALLEL_N_JOBS
+from worldcar.utils import (
+    clear_bounding_box_cache,
+    format_distance,
+    get_bounding_box,
+    meters_to_km,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def compute_graph_statistics(G: nx.MultiDiGraph) -> Dict[str, Any]:
+# NetworkX dispatch backend used for connectivity analysis when the caller
+# does not pass one (e.g. "cugraph", "graphblas", "parallel"). None leaves
+# the choice to nx.config.backend_priority, which tries backends only for
+# graphs they support; with nx-cugraph installed, exporting
+# NX_CUGRAPH_AUTOCONFIG=True puts the GPU first.
+DEFAULT_BACKEND: Optional[str] = None
+
+# Memoized compute_graph_statistics() results: graph -> ((num_nodes,
+# num_edges), {backend: stats}). The counts act as a cheap version tag;
+# entries disappear together with the graph.
+_stats_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[Tuple[int, int], Dict[Optional[str], GraphStats]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(slots=True, eq=False)
+class GraphStats(Mapping):
+    """
+    Statistics returned by compute_graph_statistics().
+
+    A slotted record rather than a dict: smaller per instance and faster
+    attribute access (stats.num_nodes). It is also a read-only Mapping over
+    its fields, so code written against the old dict result (stats['key'],
+    .get(), .items(), 'key' in stats, comparison with a dict) keeps
+    working; use to_dict() when a real dict is needed, e.g. for json.
+
+    The counts, lengths, degree, density and bounding box are computed up
+    front (the bounding box comes out of the same pass as the lengths). The
+    connected-component fields are computed from the graph on first access,
+    so callers that only need sizes and lengths (e.g. summarize_graph())
+    skip the component search. Lazy results are shared by every record
+    handed out for the same cached computation. Pickling resolves them and
+    drops the graph reference.
+    """
+
+    num_nodes: int
+    num_edges: int
+    total_length_m: float
+    total_length_km: float
+    avg_edge_length_m: float
+    min_edge_length_m: float
+    max_edge_length_m: float
+    avg_degree: float
+    network_density: float
+    is_directed: bool
+    is_multigraph: bool
+    bounding_box: Dict[str, float]
+    _graph: Optional[nx.Graph] = field(default=None, repr=False)
+    _backend: Optional[str] = field(default=None, repr=False)
+    _shared: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def num_connected_components(self) -> int:
+        """Number of (weakly) connected components."""
+        return self._components()[0]
+
+    @property
+    def largest_component_size(self) -> int:
+        """Node count of the largest component."""
+        return self._components()[1]
+
+    @property
+    def largest_component_pct(self) -> float:
+        """Share of all nodes in the largest component, in percent."""
+        num_components, largest = self._components()
+        if not num_components:
+            return 0.0
+        return (largest / self.num_nodes) * 100
+
+    def _components(self) -> Tuple[int, int]:
+        """
+        Return (num_components, largest_size), computing them once.
+
+        Raises:
+            RuntimeError: If the graph gained or lost nodes or edges since
+                the record was computed
+        """
+        components = self._shared.get('components')
+        if components is None:
+            G = self._graph
+            if G is None or (G.number_of_nodes(), G.number_of_edges()) != (
+                self.num_nodes, self.num_edges
+            ):
+                raise RuntimeError(
+                    "Graph changed since its statistics were computed; "
+                    "call compute_graph_statistics() again"
+                )
+
+            # Single pass; only sizes are kept, not the component node sets
+            num_components = 0
+            largest = 0
+            for size in _iter_component_sizes(G, self._backend):
+                num_components += 1
+                if size > largest:
+                    largest = size
+            components = (num_components, largest)
+            self._shared['components'] = components
+        return components
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _GRAPH_STATS_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_GRAPH_STATS_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_GRAPH_STATS_FIELDS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _GRAPH_STATS_FIELDS
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle the resolved values, not the graph behind the lazy fields
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name in _EAGER_FIELDS:
+            setattr(self, name, state[name])
+        self._graph = None
+        self._backend = None
+        self._shared = {
+            'components': (
+                state['num_connected_components'],
+                state['largest_component_size'],
+            ),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary, computing any lazy fields.
+
+        Returns:
+            Dictionary with one key per field and its own bounding_box dict
+        """
+        result = {name: getattr(self, name) for name in _GRAPH_STATS_FIELDS}
+        result['bounding_box'] = dict(self.bounding_box)
+        return result
+
+
+_EAGER_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(GraphStats) if not f.name.startswith('_')
+)
+
+# Public field names, eager and lazy, in the order of the original dict result
+_GRAPH_STATS_FIELDS: Tuple[str, ...] = (
+    'num_nodes',
+    'num_edges',
+    'total_length_m',
+    'total_length_km',
+    'avg_edge_length_m',
+    'min_edge_length_m',
+    'max_edge_length_m',
+    'num_connected_components',
+    'largest_component_size',
+    'largest_component_pct',
+    'avg_degree',
+    'network_density',
+    'is_directed',
+    'is_multigraph',
+    'bounding_box',
+)
+
+
+def compute_graph_statistics(
+    G: nx.MultiDiGraph,
+    backend: Optional[str] = None
+) -> GraphStats:
     """
     Compute comprehensive statistics for a road network graph.
 
     Calculates various metrics including node/edge counts, total road length,
     connectivity information, and geographic extent.
 
+    Results are memoized per graph and backend, and reused while the
+    graph's node and edge counts are unchanged. Mutations that keep both
+    counts (e.g. editing edge lengths) are not detected; call
+    clear_statistics_cache() after them.
+
+    The component fields are evaluated on first access (see GraphStats),
+    so the returned record keeps a reference to G.
+
     Args:
         G: NetworkX road network graph
+        backend: NetworkX dispatch backend for the connectivity analysis
+                 (e.g. "cugraph", "graphblas"); defaults to DEFAULT_BACKEND
 
     Returns:
-        Dictionary with graph statistics:
+        GraphStats record, readable by attribute or by key:
         {
             'num_nodes': int,
             'num_edges': int,
@@ -53,20 +247,27 @@ def compute_graph_statistics(G: nx.MultiDiGraph) -> Dict[str, Any]:
         >>> print(f"Network has {stats['num_nodes']} nodes")
         >>> print(f"Total road length: {stats['total_length_km']:.2f} km")
     """
-    logger.info("Computing graph statistics...")
-
     # Basic counts
     num_nodes = G.number_of_nodes()
     num_edges = G.number_of_edges()
 
-    # Edge length statistics
-    edge_lengths = [data.get('length', 0.0) for u, v, data in G.edges(data=True)]
+    per_backend = _cached_statistics(G, num_nodes, num_edges)
+    if backend in per_backend:
+        return _copy_stats(per_backend[backend], G)
+
+    logger.info("Computing graph statistics...")
+
+    is_directed = G.is_directed()
+    is_multigraph = G.is_multigraph()
+
+    # Edge length statistics and geographic extent, in one fused pass
+    scan = _fused_scan(G)
 
-    if edge_lengths:
-        total_length_m = sum(edge_lengths)
-        avg_edge_length_m = total_length_m / len(edge_lengths)
-        min_edge_length_m = min(edge_lengths)
-        max_edge_length_m = max(edge_lengths)
+    if num_edges:
+        total_length_m = scan['total_length_m']
+        avg_edge_length_m = total_length_m / num_edges
+        min_edge_length_m = scan['min_edge_length_m']
+        max_edge_length_m = scan['max_edge_length_m']
     else:
         total_length_m = 0.0
         avg_edge_length_m = 0.0
@@ -75,75 +276,301 @@ def compute_graph_statistics(G: nx.MultiDiGraph) -> Dict[str, Any]:
 
     total_length_km = meters_to_km(total_length_m)
 
-    # Connectivity analysis
-    if G.is_directed():
-        num_components = nx.number_weakly_connected_components(G)
-        components = list(nx.weakly_connected_components(G))
-    else:
-        num_components = nx.number_connected_components(G)
-        components = list(nx.connected_components(G))
-
-    if components:
-        largest_component_size = len(max(components, key=len))
-        largest_component_pct = (largest_component_size / num_nodes) * 100
-    else:
-        largest_component_size = 0
-        largest_component_pct = 0.0
-
-    # Degree statistics
+    # Degree statistics (every edge adds 2 to the degree sum, self-loops
+    # included, for directed and undirected graphs alike)
     if num_nodes > 0:
-        degrees = [degree for node, degree in G.degree()]
-        avg_degree = sum(degrees) / len(degrees)
+        avg_degree = 2 * num_edges / num_nodes
     else:
         avg_degree = 0.0
 
-    # Network density
-    if G.is_directed():
-        max_edges = num_nodes * (num_nodes - 1)
-    else:
-        max_edges = num_nodes * (num_nodes - 1) / 2
-
-    if max_edges > 0:
-        network_density = num_edges / max_edges
-    else:
+    # Network density: E / (n(n-1)) directed, 2E / (n(n-1)) undirected,
+    # kept in integers up to the single division
+    if num_nodes < 2 or not num_edges:
         network_density = 0.0
+    elif is_directed:
+        network_density = num_edges / (num_nodes * (num_nodes - 1))
+    else:
+        network_density = 2 * num_edges / (num_nodes * (num_nodes - 1))
 
     # Geographic extent
-    try:
-        bounding_box = get_bounding_box(G)
-    except Exception as e:
-        logger.warning(f"Could not compute bounding box: {e}")
+    bounding_box = scan['bounding_box']
+    if bounding_box is None:
+        logger.warning("Could not compute bounding box: missing node coordinates")
         bounding_box = {'north': 0, 'south': 0, 'east': 0, 'west': 0}
 
-    stats = {
-        'num_nodes': num_nodes,
-        'num_edges': num_edges,
-        'total_length_m': total_length_m,
-        'total_length_km': total_length_km,
-        'avg_edge_length_m': avg_edge_length_m,
-        'min_edge_length_m': min_edge_length_m,
-        'max_edge_length_m': max_edge_length_m,
-        'num_connected_components': num_components,
-        'largest_component_size': largest_component_size,
-        'largest_component_pct': largest_component_pct,
-        'avg_degree': avg_degree,
-        'network_density': network_density,
-        'is_directed': G.is_directed(),
-        'is_multigraph': G.is_multigraph(),
+    stats = GraphStats(
+        num_nodes=num_nodes,
+        num_edges=num_edges,
+        total_length_m=total_length_m,
+        total_length_km=total_length_km,
+        avg_edge_length_m=avg_edge_length_m,
+        min_edge_length_m=min_edge_length_m,
+        max_edge_length_m=max_edge_length_m,
+        avg_degree=avg_degree,
+        network_density=network_density,
+        is_directed=is_directed,
+        is_multigraph=is_multigraph,
+        bounding_box=bounding_box,
+        _backend=backend,
+    )
+
+    logger.info(f"Statistics computed: {num_nodes} nodes, {num_edges} edges")
+
+    per_backend[backend] = stats
+
+    return _copy_stats(stats, G)
+
+
+def compute_graph_statistics_many(
+    graphs: Iterable[nx.MultiDiGraph],
+    backend: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    parallel_backend: Optional[str] = None
+) -> List[GraphStats]:
+    """
+    Compute statistics for several graphs, in parallel when possible.
+
+    compute_graph_statistics() only reads its graph, so independent graphs
+    (e.g. per-district road networks) are processed concurrently with
+    joblib, by default in worker processes on all CPU cores (see
+    STATS_PARALLEL_BACKEND and STATS_PARALLEL_N_JOBS in config). Runs a
+    serial loop for a single graph, when n_jobs is 1, or when joblib is not
+    installed. With process backends each graph is pickled to a worker, so
+    the results are not memoized in this process and their component fields
+    are already resolved (see GraphStats). To parallelize the component
+    search inside one large graph instead, pass backend="parallel" with
+    nx-parallel installed.
+
+    Args:
+        graphs: Road network graphs
+        backend: NetworkX dispatch backend passed to compute_graph_statistics()
+        n_jobs: Number of joblib workers; -1 uses all CPU cores, 1 runs
+                serially (default: STATS_PARALLEL_N_JOBS)
+        parallel_backend: joblib backend name, e.g. "loky" or "threading"
+                          (default: STATS_PARALLEL_BACKEND)
+
+    Returns:
+        List of GraphStats, in the same order as graphs
+
+    Example:
+        >>> all_stats = compute_graph_statistics_many([G_kadikoy, G_besiktas])
+        >>> print([s.num_nodes for s in all_stats])
+    """
+    if n_jobs is None:
+        n_jobs = STATS_PARALLEL_N_JOBS
+    if parallel_backend is None:
+        parallel_backend = STATS_PARALLEL_BACKEND
+
+    graphs = list(graphs)
+    if joblib is None or n_jobs == 1 or len(graphs) < 2:
+        return [compute_graph_statistics(G, backend) for G in graphs]
+
+    return joblib.Parallel(n_jobs=n_jobs, backend=parallel_backend)(
+        joblib.delayed(compute_graph_statistics)(G, backend) for G in graphs
+    )
+
+
+def _fused_scan(G: nx.MultiDiGraph) -> Dict[str, Any]:
+    """
+    Collect edge length and coordinate extrema in one pass over the graph.
+
+    Walks the raw adjacency dicts once, reading each node's coordinates as
+    its row is visited, instead of separate G.edges(), G.degree() and
+    G.nodes() sweeps through NetworkX's views. Undirected edges are counted
+    once.
+
+    Args:
+        G: NetworkX road network graph
+
+    Returns:
+        Dictionary with 'total_length_m', 'min_edge_length_m',
+        'max_edge_length_m' (infinite when there are no edges) and
+        'bounding_box' (None if the graph is empty or a node lacks 'x'/'y')
+    """
+    inf = float('inf')
+    total = 0.0
+    min_length = inf
+    max_length = -inf
+    north = east = -inf
+    south = west = inf
+    has_coords = True
+
+    multigraph = G.is_multigraph()
+    seen = None if G.is_directed() else set()
+    node_data = G._node
+
+    for u, nbrs in G._adj.items():
+        data = node_data[u]
+        if has_coords:
+            if 'y' in data and 'x' in data:
+                y = data['y']
+                x = data['x']
+                if y > north:
+                    north = y
+                if y < south:
+                    south = y
+                if x > east:
+                    east = x
+                if x < west:
+                    west = x
+            else:
+                has_coords = False
+
+        for v, edges in nbrs.items():
+            if seen is not None and v in seen:
+                continue
+            for edge_data in (edges.values() if multigraph else (edges,)):
+                length = edge_data.get('length', 0.0)
+                total += length
+                if length < min_length:
+                    min_length = length
+                if length > max_length:
+                    max_length = length
+
+        if seen is not None:
+            seen.add(u)
+
+    bounding_box = None
+    if has_coords and node_data:
+        bounding_box = {'north': north, 'south': south, 'east': east, 'west': west}
+
+    return {
+        'total_length_m': total,
+        'min_edge_length_m': min_length,
+        'max_edge_length_m': max_length,
         'bounding_box': bounding_box,
     }
 
-    logger.info(f"Statistics computed: {num_nodes} nodes, {num_edges} edges")
 
-    return stats
+def clear_statistics_cache(G: Optional[nx.MultiDiGraph] = None) -> None:
+    """
+    Forget memoized statistics and bounding boxes.
+
+    Call this after mutating a graph in a way that keeps its node and edge
+    counts, so the next compute_graph_statistics() call recomputes.
+
+    Args:
+        G: Graph whose cached results to drop, or None to clear all graphs
+
+    Example:
+        >>> G.edges[u, v, 0]['length'] = 120.0
+        >>> clear_statistics_cache(G)
+    """
+    if G is None:
+        _stats_cache.clear()
+    else:
+        _stats_cache.pop(G, None)
+    clear_bounding_box_cache(G)
+
+
+def _cached_statistics(
+    G: nx.MultiDiGraph, num_nodes: int, num_edges: int
+) -> Dict[Optional[str], GraphStats]:
+    """
+    Get the graph's memoized statistics per backend, dropping stale ones.
+
+    Args:
+        G: NetworkX road network graph
+        num_nodes: Current node count of G
+        num_edges: Current edge count of G
+
+    Returns:
+        Dictionary mapping backend to cached statistics (possibly empty);
+        new results added to it are cached
+    """
+    cached = _stats_cache.get(G)
+    if cached is None or cached[0] != (num_nodes, num_edges):
+        cached = ((num_nodes, num_edges), {})
+        _stats_cache[G] = cached
+    return cached[1]
+
+
+def _copy_stats(stats: GraphStats, G: nx.MultiDiGraph) -> GraphStats:
+    """
+    Copy a cached statistics record for handing out to a caller.
+
+    The cached record holds no reference to its graph (it is the value of a
+    weak-keyed cache entry); the copy references G so its lazy fields can be
+    computed, and shares the cached record's lazy results.
+
+    Args:
+        stats: Cached statistics from compute_graph_statistics()
+        G: Graph the statistics describe
+
+    Returns:
+        Copy bound to G, with its own bounding_box dict
+    """
+    return dataclasses.replace(
+        stats, bounding_box=dict(stats.bounding_box), _graph=G
+    )
+
+
+def _count_isolates(G: nx.MultiDiGraph) -> int:
+    """
+    Count nodes with degree 0.
+
+    A node is isolated when its neighbor dicts are empty, which is checked
+    directly on the raw adjacency instead of computing every degree.
 
+    Args:
+        G: NetworkX road network graph
+
+    Returns:
+        Number of isolated nodes
+    """
+    if G.is_directed():
+        pred = G._pred
+        return sum(1 for u, succ in G._succ.items() if not succ and not pred[u])
+    return sum(1 for nbrs in G._adj.values() if not nbrs)
+
+
+def _iter_component_sizes(
+    G: nx.MultiDiGraph,
+    backend: Optional[str] = None
+) -> Iterator[int]:
+    """
+    Yield the size of each (weakly) connected component of a graph.
+
+    Components are consumed one at a time, so only the current component's
+    node set is alive at any point. The search is dispatched to the given
+    NetworkX backend, or DEFAULT_BACKEND when none is given. If that backend
+    cannot handle the graph (e.g. nx-cugraph and MultiDiGraph input), plain
+    NetworkX is used instead.
+
+    Args:
+        G: NetworkX road network graph
+        backend: NetworkX dispatch backend name, or None
+
+    Yields:
+        Number of nodes in each component
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
 
-def print_statistics(stats: Dict[str, Any]) -> None:
+    if G.is_directed():
+        find_components = nx.weakly_connected_components
+    else:
+        find_components = nx.connected_components
+
+    if backend is None:
+        components = find_components(G)
+    else:
+        try:
+            components = find_components(G, backend=backend)
+        except NotImplementedError:
+            logger.debug(f"Backend '{backend}' cannot handle this graph; using networkx")
+            components = find_components(G, backend="networkx")
+
+    for component in components:
+        yield len(component)
+
+
+def print_statistics(stats: Mapping) -> None:
     """
     Print graph statistics in a human-readable format.
 
     Args:
-        stats: Statistics dictionary from compute_graph_statistics()
+        stats: Statistics from compute_graph_statistics()
 
     Example:
         >>> stats = compute_graph_statistics(G)
@@ -214,12 +641,17 @@ def get_network_extent(G: nx.MultiDiGraph) -> Dict[str, float]:
     return get_bounding_box(G)
 
 
-def analyze_connectivity(G: nx.MultiDiGraph) -> Dict[str, Any]:
+def analyze_connectivity(
+    G: nx.MultiDiGraph,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Analyze graph connectivity properties in detail.
 
     Args:
         G: NetworkX road network graph
+        backend: NetworkX dispatch backend for the component search
+                 (e.g. "cugraph", "graphblas"); defaults to DEFAULT_BACKEND
 
     Returns:
         Dictionary with connectivity analysis:
@@ -238,21 +670,15 @@ def analyze_connectivity(G: nx.MultiDiGraph) -> Dict[str, Any]:
     """
     logger.info("Analyzing graph connectivity...")
 
-    # Determine connectivity based on graph type
-    if G.is_directed():
-        num_components = nx.number_weakly_connected_components(G)
-        components = list(nx.weakly_connected_components(G))
-        is_connected = nx.is_weakly_connected(G)
-    else:
-        num_components = nx.number_connected_components(G)
-        components = list(nx.connected_components(G))
-        is_connected = nx.is_connected(G)
+    # Single pass over the components, keeping only their sizes
+    component_sizes = list(_iter_component_sizes(G, backend))
+    component_sizes.sort(reverse=True)
 
-    # Get component sizes
-    component_sizes = sorted([len(comp) for comp in components], reverse=True)
+    num_components = len(component_sizes)
+    is_connected = num_components == 1
 
     # Count isolated nodes (nodes with degree 0)
-    isolated_nodes = len([node for node, degree in G.degree() if degree == 0])
+    isolated_nodes = _count_isolates(G)
 
     analysis = {
         'is_connected': is_connected,
@@ -292,9 +718,25 @@ def get_degree_statistics(G: nx.MultiDiGraph) -> Dict[str, Any]:
         >>> print(f"Average degree: {deg_stats['avg_degree']:.2f}")
         >>> print(f"Max degree (busiest intersection): {deg_stats['max_degree']}")
     """
-    degrees = [degree for node, degree in G.degree()]
+    num_nodes = G.number_of_nodes()
+    if G.is_directed() and G.is_multigraph():
+        # In + out degree straight from the raw adjacency dicts (one len()
+        # per neighbor's edge-key dict), skipping DegreeView's per-node
+        # generator machinery
+        degrees = np.fromiter(
+            (
+                sum(map(len, succ.values())) + sum(map(len, pred.values()))
+                for succ, pred in zip(G._succ.values(), G._pred.values())
+            ),
+            dtype=np.int64,
+            count=num_nodes,
+        )
+    else:
+        degrees = np.fromiter(
+            (degree for _, degree in G.degree()), dtype=np.int64, count=num_nodes
+        )
 
-    if not degrees:
+    if not num_nodes:
         return {
             'avg_degree': 0.0,
             'min_degree': 0,
@@ -304,29 +746,32 @@ def get_degree_statistics(G: nx.MultiDiGraph) -> Dict[str, Any]:
         }
 
     # Basic statistics
-    avg_degree = sum(degrees) / len(degrees)
-    min_degree = min(degrees)
-    max_degree = max(degrees)
-
-    # Median degree
-    sorted_degrees = sorted(degrees)
-    n = len(sorted_degrees)
-    if n % 2 == 0:
-        median_degree = (sorted_degrees[n // 2 - 1] + sorted_degrees[n // 2]) / 2
-    else:
-        median_degree = sorted_degrees[n // 2]
-
-    # Degree distribution
-    degree_distribution = {}
-    for degree in degrees:
-        degree_distribution[degree] = degree_distribution.get(degree, 0) + 1
+    avg_degree = float(degrees.mean())
+    min_degree = int(degrees.min())
+    max_degree = int(degrees.max())
+
+    # Degree distribution (road network degrees are small, so a histogram
+    # over 0..max_degree is compact)
+    counts = np.bincount(degrees)
+
+    # Median read off the histogram, which degree_distribution needs anyway:
+    # the k-th smallest degree is the first bin whose cumulative count
+    # exceeds k. O(max_degree), with no sort or partition of the degree
+    # array as np.median would do.
+    cumulative = np.cumsum(counts)
+    lower, upper = np.searchsorted(
+        cumulative, [(num_nodes - 1) // 2, num_nodes // 2], side='right'
+    )
+    median_degree = (int(lower) + int(upper)) / 2
 
     return {
         'avg_degree': avg_degree,
         'min_degree': min_degree,
         'max_degree': max_degree,
         'median_degree': median_degree,
-        'degree_distribution': degree_distribution,
+        'degree_distribution': {
+            degree: count for degree, count in enumerate(counts.tolist()) if count
+        },
     }
 
 
@@ -344,7 +789,10 @@ def summarize_graph(G: nx.MultiDiGraph) -> str:
         >>> print(summarize_graph(G))
         Road network: 12,453 nodes, 28,901 edges, 456.78 km
     """
+    # Only the counts and total length are read, so the lazy component
+    # search never runs
     stats = compute_graph_statistics(G)
+
     return (
         f"Road network: {stats['num_nodes']:,} nodes, "
         f"{stats['num_edges']:,} edges, "
@@ -7,7 +7,10 @@ including distance calculations, validation, and formatting.
 
 import math
 import os
-from typing import Tuple, Optional, Dict, Any
+import weakref
+from itertools import islice
+from operator import itemgetter
+from typing import Tuple, Optional, Dict, Any, Iterator
 import networkx as nx
 import numpy as np
 
@@ -20,6 +23,54 @@ from worldcar.config import (
     DISTANCE_PRECISION,
 )
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Earth's radius in meters (slightly below OSMnx's, keeping A* admissible)
+EARTH_RADIUS_M = 6371000.0
+
+# Backends accepted by haversine_matrix(method=...)
+HAVERSINE_MATRIX_METHODS = ("auto", "numba", "numexpr", "cupy", "numpy")
+
+# Haversine over broadcast radian inputs a/b (lat) and c/d (lon), for
+# numexpr. Same arcsin form as _haversine() and _haversine_array().
+_HAVERSINE_EXPR = (
+    "2 * R * arcsin(sqrt(sin((b - a) / 2) ** 2"
+    " + cos(a) * cos(b) * sin((d - c) / 2) ** 2))"
+)
+
+# Node coordinates in structure-of-arrays form: graph -> (num_nodes, lats,
+# lons, index), where index is built on first use. See
+# get_coordinate_arrays().
+_coord_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Memoized get_bounding_box() results: graph -> (num_nodes, bbox). Entries
+# disappear together with the graph.
+_bbox_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, Dict[str, float]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Memoized precompute_min_weight_adj() results:
+# graph -> {(weight, default): adj}
+_min_weight_adj_cache: "weakref.WeakKeyDictionary[nx.Graph, Dict[Tuple[str, float], Dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 # ============================================================================
 # Distance Calculations
@@ -33,6 +84,8 @@ def haversine_distance(
 
     Uses the Haversine formula to compute the distance between two geographic
     coordinates on a sphere. Accurate for small to medium distances.
+    Compiled with Numba when it is installed; for many points at once use
+    haversine_distance_batch().
 
     Args:
         lat1: Latitude of first point in decimal degrees
@@ -47,26 +100,190 @@ def haversine_distance(
         >>> # Distance from Moda to Fenerbahçe (Kadıköy, Istanbul)
         >>> dist = haversine_distance(40.9856, 29.0298, 40.9638, 29.0408)
         >>> print(f"{dist:.0f} meters")
-        2534 meters
+        2594 meters
+    """
+    return _haversine(lat1, lon1, lat2, lon2)
+
+
+def haversine_distance_batch(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate great circle distances for many pairs of points at once.
+
+    Vectorized version of haversine_distance(). Inputs are broadcast
+    against each other, so one point can be compared with many.
+
+    Args:
+        lat1: Latitudes of first points in decimal degrees
+        lon1: Longitudes of first points in decimal degrees
+        lat2: Latitudes of second points in decimal degrees
+        lon2: Longitudes of second points in decimal degrees
+
+    Returns:
+        Array of distances in meters
+
+    Example:
+        >>> dists = haversine_distance_batch(
+        ...     np.array([40.9856, 40.9700]), np.array([29.0298, 29.0300]),
+        ...     40.9638, 29.0408,
+        ... )
+        >>> print(dists.round())
+        [2594. 1139.]
+    """
+    return _haversine_array(np, lat1, lon1, lat2, lon2)
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
-    # Earth's radius in meters
-    R = 6371000
+    Scalar Haversine kernel behind haversine_distance().
 
-    # Convert degrees to radians
+    Uses only the math module so Numba can compile it (see below).
+    """
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
+    delta_lat = lat2_rad - lat1_rad
     delta_lon = math.radians(lon2 - lon1)
 
-    # Haversine formula
     a = (
         math.sin(delta_lat / 2) ** 2
         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    distance = R * c
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+# Compile the scalar kernel when Numba is installed (optional dependency)
+if njit is not None:
+    _haversine = njit(fastmath=True, cache=True)(_haversine)
 
-    return distance
+
+def _haversine_array(xp: Any, lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+    """
+    Broadcast Haversine kernel behind the batch and matrix functions.
+
+    Written against an array module xp (numpy or cupy) so the same code runs
+    on the CPU and the GPU.
+    """
+    lat1_rad = xp.radians(lat1)
+    lat2_rad = xp.radians(lat2)
+    delta_lat = lat2_rad - lat1_rad
+    delta_lon = xp.radians(xp.subtract(lon2, lon1))
+
+    a = (
+        xp.sin(delta_lat / 2) ** 2
+        + xp.cos(lat1_rad) * xp.cos(lat2_rad) * xp.sin(delta_lon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * xp.arcsin(xp.sqrt(a))
+
+
+def haversine_matrix(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    method: str = "auto"
+) -> np.ndarray:
+    """
+    Calculate the full origin-destination distance matrix between two point sets.
+
+    Entry [i, j] is the great circle distance from point i of the first set
+    to point j of the second. Available backends:
+
+    - "numba": rows computed in parallel across CPU cores (Numba)
+    - "numexpr": multithreaded, vectorized sin/cos (SVML on Intel CPUs)
+    - "cupy": computed on the GPU; worthwhile for million-pair matrices
+    - "numpy": plain NumPy broadcasting
+
+    "auto" picks Numba, then NumExpr, then NumPy, whichever is installed
+    first. The GPU is only used when asked for, since copying the inputs
+    and result dominates for small matrices.
+
+    Args:
+        lat1: Latitudes of origin points in decimal degrees, shape (n,)
+        lon1: Longitudes of origin points in decimal degrees, shape (n,)
+        lat2: Latitudes of destination points in decimal degrees, shape (m,)
+        lon2: Longitudes of destination points in decimal degrees, shape (m,)
+        method: One of HAVERSINE_MATRIX_METHODS (default: "auto")
+
+    Returns:
+        Array of distances in meters, shape (n, m)
+
+    Raises:
+        ValueError: If method is unknown or its package is not installed
+
+    Example:
+        >>> lats = np.array([40.9856, 40.9638])
+        >>> lons = np.array([29.0298, 29.0408])
+        >>> print(haversine_matrix(lats, lons, lats, lons).round())
+        [[   0. 2594.]
+         [2594.    0.]]
+    """
+    if method not in HAVERSINE_MATRIX_METHODS:
+        raise ValueError(
+            f"Unknown method '{method}'. "
+            f"Must be one of {', '.join(HAVERSINE_MATRIX_METHODS)}"
+        )
+
+    if method == "auto":
+        if njit is not None:
+            method = "numba"
+        elif numexpr is not None:
+            method = "numexpr"
+        else:
+            method = "numpy"
+    elif method == "numba" and njit is None:
+        raise ValueError("method='numba' requires numba (pip install numba)")
+    elif method == "numexpr" and numexpr is None:
+        raise ValueError("method='numexpr' requires numexpr (pip install numexpr)")
+    elif method == "cupy" and cupy is None:
+        raise ValueError("method='cupy' requires CuPy (pip install cupy)")
+
+    lat1 = np.ascontiguousarray(lat1, dtype=np.float64).ravel()
+    lon1 = np.ascontiguousarray(lon1, dtype=np.float64).ravel()
+    lat2 = np.ascontiguousarray(lat2, dtype=np.float64).ravel()
+    lon2 = np.ascontiguousarray(lon2, dtype=np.float64).ravel()
+
+    if method == "numba":
+        return _haversine_matrix(lat1, lon1, lat2, lon2)
+    if method == "numexpr":
+        return numexpr.evaluate(
+            _HAVERSINE_EXPR,
+            local_dict={
+                'a': np.radians(lat1)[:, None],
+                'b': np.radians(lat2)[None, :],
+                'c': np.radians(lon1)[:, None],
+                'd': np.radians(lon2)[None, :],
+                'R': EARTH_RADIUS_M,
+            },
+        )
+    if method == "cupy":
+        return cupy.asnumpy(_haversine_array(
+            cupy,
+            cupy.asarray(lat1)[:, None], cupy.asarray(lon1)[:, None],
+            cupy.asarray(lat2)[None, :], cupy.asarray(lon2)[None, :],
+        ))
+    return _haversine_array(
+        np, lat1[:, None], lon1[:, None], lat2[None, :], lon2[None, :]
+    )
+
+
+def _haversine_matrix(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Row-parallel kernel behind haversine_matrix() (Numba only)."""
+    n = lat1.shape[0]
+    m = lat2.shape[0]
+    out = np.empty((n, m), dtype=np.float64)
+    for i in prange(n):
+        for j in range(m):
+            out[i, j] = _haversine(lat1[i], lon1[i], lat2[j], lon2[j])
+    return out
+
+
+if njit is not None:
+    _haversine_matrix = njit(parallel=True, fastmath=True, cache=True)(
+        _haversine_matrix
+    )
 
 
 def euclidean_distance(
@@ -84,7 +301,28 @@ def euclidean_distance(
     Returns:
         Euclidean distance between the two points
     """
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+def euclidean_distance_batch(
+    x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate Euclidean distances for many pairs of points at once.
+
+    Vectorized version of euclidean_distance(); inputs are broadcast
+    against each other.
+
+    Args:
+        x1: X coordinates of first points
+        y1: Y coordinates of first points
+        x2: X coordinates of second points
+        y2: Y coordinates of second points
+
+    Returns:
+        Array of Euclidean distances
+    """
+    return np.hypot(np.subtract(x2, x1), np.subtract(y2, y1))
 
 
 # ============================================================================
@@ -108,6 +346,14 @@ def validate_coordinates(lat: float, lon: float) -> bool:
         >>> validate_coordinates(91.0, 29.0298)  # Invalid latitude
         False
     """
+    # Fast path for plain floats: NaN fails every comparison and infinities
+    # fail the range checks, so the ranges alone decide
+    if type(lat) is float and type(lon) is float:
+        return (
+            MIN_LATITUDE <= lat <= MAX_LATITUDE
+            and MIN_LONGITUDE <= lon <= MAX_LONGITUDE
+        )
+
     if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
         return False
 
@@ -126,6 +372,38 @@ def validate_coordinates(lat: float, lon: float) -> bool:
     return True
 
 
+def coordinates_valid_mask(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Flag which of many latitude/longitude pairs are valid.
+
+    Vectorized version of validate_coordinates(): the range checks run as
+    whole-array NumPy comparisons instead of one Python call per point.
+    Invalid pairs are reported in the mask, never raised; see
+    simple_node_mapper.validate_coordinates_batch() for the raising variant.
+
+    Args:
+        lats: Latitudes in decimal degrees
+        lons: Longitudes in decimal degrees
+
+    Returns:
+        Boolean array, True where the coordinate pair is valid
+
+    Example:
+        >>> coordinates_valid_mask(np.array([40.98, 91.0]),
+        ...                        np.array([29.03, 29.03]))
+        array([ True, False])
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    # NaN compares false and infinities fall outside the ranges, so the
+    # range checks also reject non-finite values
+    return (
+        (lats >= MIN_LATITUDE) & (lats <= MAX_LATITUDE)
+        & (lons >= MIN_LONGITUDE) & (lons <= MAX_LONGITUDE)
+    )
+
+
 def validate_coordinate_pair(
     origin: Tuple[float, float], destination: Tuple[float, float]
 ) -> Tuple[bool, Optional[str]]:
@@ -206,17 +484,18 @@ def validate_graph(G: nx.MultiDiGraph) -> Tuple[bool, Optional[str]]:
     if G.number_of_nodes() == 0:
         return False, "Graph has no nodes"
 
-    if G.number_of_edges() == 0:
+    # Only the first 10 nodes/edges are sampled, read lazily so nothing
+    # else is materialized (counting multigraph edges alone is O(V + E))
+    sample_edges = list(islice(G.edges(data=True), 10))
+    if not sample_edges:
         return False, "Graph has no edges"
 
     # Check that nodes have coordinate attributes
-    sample_nodes = list(G.nodes(data=True))[:min(10, G.number_of_nodes())]
-    for node_id, data in sample_nodes:
+    for node_id, data in islice(G.nodes(data=True), 10):
         if 'y' not in data or 'x' not in data:
             return False, f"Node {node_id} missing coordinate attributes (x, y)"
 
     # Check that edges have length attribute
-    sample_edges = list(G.edges(data=True))[:min(10, G.number_of_edges())]
     for u, v, data in sample_edges:
         if 'length' not in data:
             return False, f"Edge ({u}, {v}) missing 'length' attribute"
@@ -232,6 +511,9 @@ def get_bounding_box(G: nx.MultiDiGraph) -> Dict[str, float]:
     """
     Get the geographic bounding box of a graph.
 
+    Results are memoized per graph and reused while its node count is
+    unchanged. Call clear_bounding_box_cache() after moving nodes.
+
     Args:
         G: NetworkX graph with node attributes 'x' (longitude) and 'y' (latitude)
 
@@ -243,15 +525,111 @@ def get_bounding_box(G: nx.MultiDiGraph) -> Dict[str, float]:
         >>> print(f"North: {bbox['north']:.4f}, South: {bbox['south']:.4f}")
         North: 40.9900, South: 40.9500
     """
-    lats = [data['y'] for _, data in G.nodes(data=True)]
-    lons = [data['x'] for _, data in G.nodes(data=True)]
-
-    return {
-        'north': max(lats),
-        'south': min(lats),
-        'east': max(lons),
-        'west': min(lons),
+    num_nodes = G.number_of_nodes()
+    cached = _bbox_cache.get(G)
+    if cached is not None and cached[0] == num_nodes:
+        return dict(cached[1])
+
+    lats, lons = _coordinate_columns(G)
+
+    bbox = {
+        'north': float(lats.max()),
+        'south': float(lats.min()),
+        'east': float(lons.max()),
+        'west': float(lons.min()),
     }
+    _bbox_cache[G] = (num_nodes, bbox)
+
+    return dict(bbox)
+
+
+def get_coordinate_arrays(
+    G: nx.MultiDiGraph
+) -> Tuple[np.ndarray, np.ndarray, Dict[Any, int]]:
+    """
+    Get the graph's node coordinates as two contiguous arrays.
+
+    Built in one pass over the nodes and cached per graph, so bounding box,
+    extent, nearest-node and distance queries reduce over flat float64
+    arrays instead of walking the node attribute dicts. The cache is rebuilt
+    when the node count changes; call clear_bounding_box_cache() after
+    moving nodes.
+
+    Args:
+        G: NetworkX graph with node attributes 'x' (longitude) and 'y' (latitude)
+
+    Returns:
+        Tuple of (lats, lons, index) where index maps node ID to array position
+
+    Raises:
+        ValueError: If a node is missing coordinate attributes
+
+    Example:
+        >>> lats, lons, index = get_coordinate_arrays(G)
+        >>> lat = lats[index[node_id]]
+    """
+    lats, lons = _coordinate_columns(G)
+
+    cached = _coord_cache[G]
+    index = cached[3]
+    if index is None:
+        index = dict(zip(G._node, range(len(lats))))
+        _coord_cache[G] = (cached[0], lats, lons, index)
+
+    return lats, lons, index
+
+
+def _coordinate_columns(G: nx.MultiDiGraph) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get (or build and cache) the latitude and longitude arrays of a graph.
+
+    The node ID index is left for get_coordinate_arrays() to add on demand,
+    so a bounding box alone never pays for it.
+
+    Args:
+        G: NetworkX graph with node attributes 'x' (longitude) and 'y' (latitude)
+
+    Returns:
+        Tuple of (lats, lons) in node order
+
+    Raises:
+        ValueError: If a node is missing coordinate attributes
+    """
+    num_nodes = len(G._node)
+    cached = _coord_cache.get(G)
+    if cached is not None and cached[0] == num_nodes:
+        return cached[1], cached[2]
+
+    node_data = G._node.values()
+    try:
+        lats = np.fromiter(map(itemgetter('y'), node_data), dtype=np.float64, count=num_nodes)
+        lons = np.fromiter(map(itemgetter('x'), node_data), dtype=np.float64, count=num_nodes)
+    except KeyError:
+        missing = next(
+            node_id for node_id, data in G._node.items()
+            if 'x' not in data or 'y' not in data
+        )
+        raise ValueError(
+            f"Node {missing} missing coordinate attributes (x, y)."
+        ) from None
+
+    _coord_cache[G] = (num_nodes, lats, lons, None)
+    return lats, lons
+
+
+def clear_bounding_box_cache(G: Optional[nx.MultiDiGraph] = None) -> None:
+    """
+    Forget memoized get_bounding_box() and get_coordinate_arrays() results.
+
+    Args:
+        G: Graph whose cached coordinates to drop, or None to clear all
+    """
+    if G is None:
+        _bbox_cache.clear()
+        _coord_cache.clear()
+    else:
+        _bbox_cache.pop(G, None)
+        _coord_cache.pop(G, None)
 
 
 def get_graph_extent(G: nx.MultiDiGraph) -> Dict[str, Any]:
@@ -295,6 +673,65 @@ def get_graph_extent(G: nx.MultiDiGraph) -> Dict[str, Any]:
     }
 
 
+def node_id_array(node_list: list) -> np.ndarray:
+    """
+    Pack node IDs into a 1-D array, as int64 when they are all integers.
+
+    Any other IDs (strings, tuples, ...) go into an object array, so each
+    element is exactly one node ID.
+
+    Args:
+        node_list: Node IDs
+
+    Returns:
+        int64 array for integer IDs (e.g. OSM IDs), object array otherwise
+
+    Example:
+        >>> node_id_array([(0, 0), (0, 1)]).shape
+        (2,)
+    """
+    if all(
+        isinstance(node_id, (int, np.integer)) and not isinstance(node_id, bool)
+        for node_id in node_list
+    ):
+        try:
+            return np.array(node_list, dtype=np.int64)
+        except OverflowError:
+            pass
+
+    # Filled element-wise so tuple IDs are not unpacked into extra dimensions
+    node_ids = np.empty(len(node_list), dtype=object)
+    for i, node_id in enumerate(node_list):
+        node_ids[i] = node_id
+    return node_ids
+
+
+def graph_version(G: nx.Graph) -> int:
+    """
+    Get a cheap structural stamp for invalidating per-graph caches.
+
+    The stamp is the number of nodes, read straight from the node dict, so
+    it costs O(1) and can be checked on every query. It changes whenever
+    nodes are added or removed, which keeps caches indexed by node from
+    going stale on new node IDs. Edge-only edits (adding, removing or
+    reweighting edges between existing nodes) do not change it; callers
+    must drop the affected caches explicitly after such edits.
+
+    Args:
+        G: NetworkX graph
+
+    Returns:
+        Number of nodes in the graph
+
+    Example:
+        >>> before = graph_version(G)
+        >>> G.add_node(99)
+        >>> graph_version(G) != before
+        True
+    """
+    return len(G._node)
+
+
 # ============================================================================
 # File System Utilities
 # ============================================================================
@@ -316,6 +753,18 @@ def ensure_directory_exists(path: str) -> None:
 # Formatting Utilities
 # ============================================================================
 
+# Format strings built once at import; the bound str.format methods are
+# reused by every call instead of re-parsing a nested format spec. The
+# precision settings are imported by value, so baking them in here changes
+# nothing: editing worldcar.config at runtime never reached these helpers.
+_FMT_M = f"{{:.{DISTANCE_PRECISION}f}} m".format
+_FMT_KM = f"{{:.{DISTANCE_PRECISION}f}} km".format
+_FMT_COORDS = f"({{:.{COORDINATE_PRECISION}f}}, {{:.{COORDINATE_PRECISION}f}})".format
+_FMT_S = "{:.2f} s".format
+_FMT_MIN = "{:.2f} min".format
+_FMT_H = "{:.2f} h".format
+
+
 def format_distance(meters: float) -> str:
     """
     Format distance in meters to human-readable string.
@@ -337,10 +786,10 @@ def format_distance(meters: float) -> str:
         15.23 km
     """
     if meters < 1000:
-        return f"{meters:.{DISTANCE_PRECISION}f} m"
+        return _FMT_M(meters)
     else:
         km = meters / 1000
-        return f"{km:.{DISTANCE_PRECISION}f} km"
+        return _FMT_KM(km)
 
 
 def format_coordinates(lat: float, lon: float) -> str:
@@ -358,7 +807,7 @@ def format_coordinates(lat: float, lon: float) -> str:
         >>> print(format_coordinates(40.9856, 29.0298))
         (40.985600, 29.029800)
     """
-    return f"({lat:.{COORDINATE_PRECISION}f}, {lon:.{COORDINATE_PRECISION}f})"
+    return _FMT_COORDS(lat, lon)
 
 
 def format_time(seconds: float) -> str:
@@ -378,13 +827,13 @@ def format_time(seconds: float) -> str:
         2.08 min
     """
     if seconds < 60:
-        return f"{seconds:.2f} s"
+        return _FMT_S(seconds)
     elif seconds < 3600:
         minutes = seconds / 60
-        return f"{minutes:.2f} min"
+        return _FMT_MIN(minutes)
     else:
         hours = seconds / 3600
-        return f"{hours:.2f} h"
+        return _FMT_H(hours)
 
 
 # ============================================================================
@@ -397,6 +846,10 @@ def compute_path_total_length(
     """
     Compute total length of a path in the graph.
 
+    Each hop is a single lookup in the graph's precomputed minimum-weight
+    adjacency (see precompute_min_weight_adj), so parallel edges are not
+    rescanned per query.
+
     Args:
         G: NetworkX graph
         path: List of node IDs forming the path
@@ -411,25 +864,106 @@ def compute_path_total_length(
         >>> print(f"Path length: {length:.2f} meters")
         Path length: 2534.50 meters
     """
-    total_length = 0.0
+    adj = precompute_min_weight_adj(G, weight)
 
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
+    return sum((adj[u][v] for u, v in zip(path, path[1:])), 0.0)
 
-        # Get edge data (handle MultiDiGraph with multiple edges)
-        if G.is_multigraph():
-            # Get minimum weight edge if multiple edges exist
-            edge_data = min(
-                G[u][v].values(),
-                key=lambda x: x.get(weight, float('inf'))
-            )
-        else:
-            edge_data = G[u][v]
 
-        edge_length = edge_data.get(weight, 0.0)
-        total_length += edge_length
+def precompute_min_weight_adj(
+    G: nx.MultiDiGraph, weight: str = "length", default: float = 0.0
+) -> Dict[Any, Dict[Any, float]]:
+    """
+    Get (or build and cache) a u -> v -> minimum edge weight mapping.
+
+    Parallel edges are collapsed to the smallest weight among those that
+    have the attribute; a pair whose edges all lack it counts as default,
+    as does a simple-graph edge without it. Built in one pass over the
+    adjacency and memoized per graph, weight and default; it is not updated
+    if the graph is mutated afterwards (see clear_min_weight_adj_cache).
+
+    Args:
+        G: NetworkX graph
+        weight: Edge attribute to use (default: "length")
+        default: Weight of node pairs with no edge carrying the attribute
+            (default: 0.0)
+
+    Returns:
+        Dict of dicts, adj[u][v] being the minimum weight from u to v
+
+    Example:
+        >>> adj = precompute_min_weight_adj(G)
+        >>> print(f"Edge 1->2: {adj[1][2]:.2f} meters")
+    """
+    per_graph = _min_weight_adj_cache.setdefault(G, {})
+    key = (weight, default)
+    if key in per_graph:
+        return per_graph[key]
+
+    if G.is_multigraph():
+        adj = {
+            u: {
+                v: min(
+                    (data[weight] for data in keydict.values() if weight in data),
+                    default=default,
+                )
+                for v, keydict in nbrs.items()
+            }
+            for u, nbrs in G._adj.items()
+        }
+    else:
+        adj = {
+            u: {v: data.get(weight, default) for v, data in nbrs.items()}
+            for u, nbrs in G._adj.items()
+        }
+
+    per_graph[key] = adj
+    return adj
+
+
+def clear_min_weight_adj_cache(G: Optional[nx.MultiDiGraph] = None) -> None:
+    """
+    Forget memoized precompute_min_weight_adj() mappings.
 
-    return total_length
+    Args:
+        G: Graph whose mappings to drop, or None to clear all
+
+    Example:
+        >>> G.add_edge(1, 2, length=10.0)
+        >>> clear_min_weight_adj_cache(G)
+    """
+    if G is None:
+        _min_weight_adj_cache.clear()
+    else:
+        _min_weight_adj_cache.pop(G, None)
+
+
+def iter_min_weight_edges(
+    G: nx.MultiDiGraph, weight: str, default: float
+) -> Iterator[Tuple[Any, Any, float]]:
+    """
+    Iterate over node pairs with parallel edges collapsed to the minimum weight.
+
+    The routing CSR matrix is built from it. Pairs are yielded grouped by
+    source node, in node order, straight from the raw adjacency dicts
+    (skipping NetworkX's view wrappers). Undirected edges are yielded in
+    both directions.
+
+    Args:
+        G: NetworkX graph
+        weight: Edge attribute to use as weight
+        default: Weight of edges missing the attribute
+
+    Yields:
+        Tuples of (u, v, min_weight)
+    """
+    if G.is_multigraph():
+        for u, nbrs in G._adj.items():
+            for v, keydict in nbrs.items():
+                yield u, v, min(data.get(weight, default) for data in keydict.values())
+    else:
+        for u, nbrs in G._adj.items():
+            for v, data in nbrs.items():
+                yield u, v, data.get(weight, default)
 
 
 # ============================================================================